@@ -1,10 +1,9 @@
 from abc import ABC
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from serenity_sdk.client.raw import CallType, SerenityClient
 from serenity_sdk.config import Environment
-from serenity_sdk.types.common import STD_DATE_FMT
 
 
 class SerenityApi(ABC):
@@ -12,6 +11,9 @@ class SerenityApi(ABC):
     Higher-level wrapper around a particular API endpoint like the Risk API or Model API. Subclasses
     add typed operations and various helper functions specific to that API group.
     """
+
+    __slots__ = ('client', 'api_group')
+
     def __init__(self, client: SerenityClient, api_group: str):
         """
         :param client: the raw client to delegate to when making API calls
@@ -20,7 +22,7 @@ class SerenityApi(ABC):
         self.client = client
         self.api_group = api_group
 
-    def _call_api(self, api_path: str, params: Dict[str, str] = {}, body_json: Any = None,
+    def _call_api(self, api_path: str, params: Optional[Dict[str, str]] = None, body_json: Any = None,
                   call_type: CallType = CallType.GET) -> Any:
         """
         Helper method for derived classes that calls a target API in the supported API group.
@@ -47,7 +49,6 @@ class SerenityApi(ABC):
 
         :param as_of_date: the universal as_of_date for all bitemporal API's
         """
-        if as_of_date is None:
-            return {}
-        else:
-            return {'asOfDate': as_of_date.strftime(STD_DATE_FMT)}
+        # date.isoformat() yields the same text as strftime(STD_DATE_FMT) without parsing a format
+        # string, and called unbound it also gives just the date part if passed a datetime
+        return {} if as_of_date is None else {'asOfDate': date.isoformat(as_of_date)}
@@ -1,3 +1,6 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any, List
 
@@ -6,6 +9,9 @@ from serenity_sdk.client.raw import SerenityClient
 from serenity_sdk.types.model import ModelMetadata
 
 
+MODEL_METADATA_CACHE_TTL_SECS = 60 * 60
+
+
 class ModelApi(SerenityApi):
     """
     Helper class for the Model Metadata API, which lets clients introspect model parameters
@@ -14,22 +20,39 @@ class ModelApi(SerenityApi):
     so you can specify which configuration you want to use for risk attribution, scenarios
     and other risk tools.
     """
+
+    __slots__ = ('_model_metadata_cache',)
+
     def __init__(self, client: SerenityClient):
         """
         :param client: the raw client to delegate to when making API calls
         """
         super().__init__(client, 'catalog')
+        self._model_metadata_cache = {}
 
-    def load_model_metadata(self, as_of_date: date = None) -> ModelMetadata:
+    def load_model_metadata(self, as_of_date: date = None, refresh: bool = False) -> ModelMetadata:
         """
-        Helper method that preloads all the model metadata into memory for easy access.
+        Helper method that preloads all the model metadata into memory for easy access. The model
+        catalog rarely changes, so the loaded metadata is cached in memory by as-of date for up to
+        `MODEL_METADATA_CACHE_TTL_SECS`, after which the latest catalog is fetched again.
 
         :param as_of_date: the effective date for the model metadata in the database, else latest if None
+        :param refresh: if True, bypass the cache and reload from the server
         """
-        model_classes = self.get_model_classes(as_of_date)
-        models = self.get_models(as_of_date)
-        model_configs = self.get_model_configurations(as_of_date)
-        return ModelMetadata(model_classes, models, model_configs)
+        now = time.monotonic()
+        (loaded_at, model_metadata) = self._model_metadata_cache.get(as_of_date, (None, None))
+        if not refresh and model_metadata is not None and now - loaded_at <= MODEL_METADATA_CACHE_TTL_SECS:
+            return model_metadata
+
+        # the three lookups are independent, so overlap them on the client's connection pool
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            model_classes = executor.submit(self.get_model_classes, as_of_date)
+            models = executor.submit(self.get_models, as_of_date)
+            model_configs = executor.submit(self.get_model_configurations, as_of_date)
+            model_metadata = ModelMetadata(model_classes.result(), models.result(), model_configs.result())
+
+        self._model_metadata_cache[as_of_date] = (now, model_metadata)
+        return model_metadata
 
     def get_model_classes(self, as_of_date: date = None) -> List[Any]:
         """
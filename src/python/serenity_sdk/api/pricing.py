@@ -17,6 +17,8 @@ from serenity_types.refdata.token import TokenAsset
 
 
 class PricerApi(SerenityApi):
+    __slots__ = ()
+
     def __init__(self, client: SerenityClient):
         """
         :param client: the raw client to delegate to when making API calls
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from serenity_sdk.api.model import ModelApi
 from serenity_sdk.api.pricing import PricerApi
 from serenity_sdk.api.refdata import RefdataApi
@@ -15,13 +17,33 @@ class SerenityApiProvider:
         """
         :param client: the raw client to wrap around for every typed endpoint
         """
+        self.client = client
+
+    # each typed wrapper is only constructed the first time it is used
+
+    @cached_property
+    def refdata_api(self) -> RefdataApi:
+        return RefdataApi(self.client)
+
+    @cached_property
+    def risk_api(self) -> RiskApi:
+        return RiskApi(self.client)
+
+    @cached_property
+    def valuation_api(self) -> ValuationApi:
+        return ValuationApi(self.client)
+
+    @cached_property
+    def pricer_api(self) -> PricerApi:
+        return PricerApi(self.client)
+
+    @cached_property
+    def model_api(self) -> ModelApi:
+        return ModelApi(self.client)
 
-        self.refdata_api = RefdataApi(client)
-        self.risk_api = RiskApi(client)
-        self.valuation_api = ValuationApi(client)
-        self.pricer_api = PricerApi(client)
-        self.model_api = ModelApi(client)
-        self.scenarios_api = ScenariosApi(client)
+    @cached_property
+    def scenarios_api(self) -> ScenariosApi:
+        return ScenariosApi(self.client)
 
     def refdata(self) -> RefdataApi:
         """
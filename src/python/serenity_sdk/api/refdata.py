@@ -1,5 +1,13 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+
 from datetime import date
-from typing import Any, AnyStr, Dict, List
+from operator import itemgetter
+from typing import Any, AnyStr, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from serenity_sdk.api.core import SerenityApi
@@ -7,18 +15,31 @@ from serenity_sdk.client.raw import SerenityClient
 from serenity_sdk.types.refdata import AssetMaster
 
 
+ASSET_MASTER_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.serenity', 'cache')
+ASSET_MASTER_CACHE_TTL_SECS = 24 * 60 * 60
+REFDATA_LOOKUP_CACHE_TTL_SECS = 60 * 60
+
+_name_and_description = itemgetter('name', 'description')
+_name_and_taxonomy_id = itemgetter('name', 'taxonomyId')
+
+
 class RefdataApi(SerenityApi):
     """
     The refdata API group covers access to the Serenity Asset Master and other supporting
     reference data needed for constructing portfolios and running risk models.
     """
+
+    __slots__ = ('_asset_masters', '_lookup_cache')
+
     def __init__(self, client: SerenityClient):
         """
         :param client: the raw client to delegate to when making API calls
         """
         super().__init__(client, 'refdata')
+        self._asset_masters = {}
+        self._lookup_cache = {}
 
-    def load_asset_master(self, as_of_date: date = None) -> AssetMaster:
+    def load_asset_master(self, as_of_date: date = None, refresh: bool = False) -> AssetMaster:
         """
         Bulk load operation that loads the whole asset master into memory so it can be
         used to help build portfolios bassed on inputs in different symbologies, and
@@ -26,11 +47,32 @@ class RefdataApi(SerenityApi):
         is always as of a date, as it can change over time, but if a date is not provided
         the system will default to the latest date.
 
+        The asset master changes at most daily, so loaded asset summaries are cached both in memory
+        and on disk under `$HOME/.serenity/cache` for up to 24 hours, keyed by connection and date.
+
         :param as_of_date: the effective date for all loaded refdata, else latest if None
+        :param refresh: if True, bypass the cache and reload from the server
         :return: an :class:`AssetMaster` object containing all asset-linked reference data
         """
-        asset_summaries = self.get_asset_summaries(as_of_date)
-        return AssetMaster(asset_summaries)
+        cache_key = f'{self._get_connection_id()}_{as_of_date.isoformat() if as_of_date else "latest"}'
+        now = time.time()
+        (loaded_at, asset_master) = self._asset_masters.get(cache_key, (None, None))
+        if not refresh and asset_master is not None and now - loaded_at <= ASSET_MASTER_CACHE_TTL_SECS:
+            return asset_master
+
+        cache_path = os.path.join(ASSET_MASTER_CACHE_DIR, f'asset_master_{cache_key}.json')
+        asset_summaries = None if refresh else RefdataApi._read_cached_asset_summaries(cache_path)
+        if asset_summaries is None:
+            asset_summaries = self.get_asset_summaries(as_of_date)
+            RefdataApi._write_cached_asset_summaries(cache_path, asset_summaries)
+            loaded_at = now
+        else:
+            # a copy read from disk is already part way through its lifetime, so expire it in memory with the file
+            loaded_at = RefdataApi._get_cache_file_time(cache_path, now)
+
+        asset_master = AssetMaster(asset_summaries)
+        self._asset_masters[cache_key] = (loaded_at, asset_master)
+        return asset_master
 
     def get_asset_summaries(self, as_of_date: date = None) -> List[Any]:
         """
@@ -52,10 +94,7 @@ class RefdataApi(SerenityApi):
 
         :return: a map from name to description
         """
-        params = self._create_std_params(as_of_date)
-        resp = self._call_api('/asset/types', params)
-        asset_types = resp['assetType']
-        return {asset_type['name']: asset_type['description'] for asset_type in asset_types}
+        return self._get_lookup('/asset/types', 'assetType', _name_and_description, as_of_date)
 
     def get_symbol_authorities(self, as_of_date: date = None) -> Dict[AnyStr, AnyStr]:
         """
@@ -63,10 +102,7 @@ class RefdataApi(SerenityApi):
 
         :return: a map from name to description
         """
-        params = self._create_std_params(as_of_date)
-        resp = self._call_api('/symbol/authorities', params)
-        authorities = resp['symbolAuthority']
-        return {authority['name']: authority['description'] for authority in authorities}
+        return self._get_lookup('/symbol/authorities', 'symbolAuthority', _name_and_description, as_of_date)
 
     def get_sector_taxonomies(self, as_of_date: date = None) -> Dict[str, UUID]:
         """
@@ -76,7 +112,93 @@ class RefdataApi(SerenityApi):
 
         :return: a map from taxonomy short name to taxonomy UUID
         """
+        return self._get_lookup('/sector/taxonomies', 'sectorTaxonomy', _name_and_taxonomy_id, as_of_date)
+
+    def _get_connection_id(self) -> str:
+        """
+        Identifies the Serenity installation and tenant this API is connected to, so on-disk caches
+        from different connections, even in the same environment, never get mixed up.
+
+        :return: the environment name plus a short hash of the API URL and tenant ID
+        """
+        config = self.client.config
+        connection_hash = hashlib.sha256(f'{config.get_url()}|{config.tenant_id}'.encode('utf-8')).hexdigest()
+        return f'{self._get_env().name.lower()}_{connection_hash[:12]}'
+
+    def _get_lookup(self, api_path: str, list_key: str, to_key_value: Callable[[Any], Tuple[Any, Any]],
+                    as_of_date: Optional[date]) -> Dict[Any, Any]:
+        """
+        Loads one of the small name-keyed reference data lookups. Like the asset master these change
+        rarely and get requested repeatedly with the same date, so each is cached in memory per date
+        for up to `REFDATA_LOOKUP_CACHE_TTL_SECS`, after which the latest values are fetched again.
+
+        :param api_path: the refdata API path to call
+        :param list_key: the key in the response holding the list of records
+        :param to_key_value: extracts the (key, value) pair from each record
+        :param as_of_date: the effective date for all loaded refdata, else latest if None
+        :return: a fresh copy of the cached lookup, so callers are free to modify it
+        """
         params = self._create_std_params(as_of_date)
-        resp = self._call_api('/sector/taxonomies', params)
-        taxonomies = resp['sectorTaxonomy']
-        return {taxonomy['name']: taxonomy['taxonomyId'] for taxonomy in taxonomies}
+        cache_key = (api_path, params.get('asOfDate'))
+        now = time.monotonic()
+        (loaded_at, lookup) = self._lookup_cache.get(cache_key, (None, None))
+        if lookup is None or now - loaded_at > REFDATA_LOOKUP_CACHE_TTL_SECS:
+            resp = self._call_api(api_path, params)
+            lookup = dict(map(to_key_value, resp[list_key]))
+            self._lookup_cache[cache_key] = (now, lookup)
+        return dict(lookup)
+
+    @staticmethod
+    def _read_cached_asset_summaries(cache_path: str) -> Optional[List[Any]]:
+        """
+        Reads asset summaries previously written by :func:`_write_cached_asset_summaries`.
+
+        :param cache_path: the cache file for this environment and as-of date
+        :return: the cached JSON asset summaries, or None if missing, expired or unreadable
+        """
+        try:
+            if time.time() - os.path.getmtime(cache_path) > ASSET_MASTER_CACHE_TTL_SECS:
+                return None
+            with open(cache_path) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_cache_file_time(cache_path: str, default: float) -> float:
+        """
+        Gets the time at which an on-disk cache file was last written.
+
+        :param cache_path: the cache file for this environment and as-of date
+        :param default: the time to use if the file has since gone away
+        :return: the file's modification time, in seconds since the epoch
+        """
+        try:
+            return os.path.getmtime(cache_path)
+        except OSError:
+            return default
+
+    @staticmethod
+    def _write_cached_asset_summaries(cache_path: str, asset_summaries: List[Any]):
+        """
+        Atomically writes asset summaries to the on-disk cache; failures are ignored, as the
+        cache is purely an optimization.
+
+        :param cache_path: the cache file for this environment and as-of date
+        :param asset_summaries: the JSON asset summaries to cache
+        """
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(asset_summaries, tmp_file)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except OSError:
+            pass
+        finally:
+            # don't leave partly-written temporary files behind in the cache directory
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
@@ -1,27 +1,46 @@
-from datetime import date
-from typing import Any, AnyStr, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, AnyStr, Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 
 from serenity_sdk.api.core import SerenityApi
-from serenity_sdk.client.raw import CallType, SerenityClient
-from serenity_sdk.types.common import STD_DATE_FMT, CalculationContext, Portfolio
+from serenity_sdk.client.raw import HTTP_POOL_MAXSIZE, CallType, SerenityClient
+from serenity_sdk.types.common import CalculationContext, Portfolio
 from serenity_sdk.types.refdata import AssetMaster
 from serenity_sdk.types.factors import RiskAttributionResult
 from serenity_sdk.types.var import VaRAnalysisResult, VaRBacktestResult
 
+if TYPE_CHECKING:
+    # Styler needs jinja2 at import time, so only import it for type checkers
+    from pandas.io.formats.style import Styler
+
+
+# default VaR quantiles; a shared, immutable tuple rather than a fresh list on every call
+DEFAULT_VAR_QUANTILES = (95, 97.5, 99)
+
+# number of distinct (as-of date, model) asset covariance matrices each RiskApi keeps in memory
+ASSET_COVARIANCE_CACHE_SIZE = 8
+
 
 class RiskApi(SerenityApi):
     """
     The risk API group covers risk attribution, VaR and (in a future release) scenario analysis.
     """
+
+    __slots__ = ('_asset_covariance_cache',)
+
     def __init__(self, client: SerenityClient):
         """
         :param client: the raw client to delegate to when making API calls
         """
         super().__init__(client, 'risk')
 
+        # full, pivoted asset covariance matrices by (as-of date, model) so portfolio subsets are just a gather
+        self._asset_covariance_cache = {}
+
     def compute_risk_attrib(self, ctx: CalculationContext,
                             portfolio: Portfolio,
                             sector_taxonomy_id: UUID = None) -> RiskAttributionResult:
@@ -40,11 +59,12 @@ class RiskApi(SerenityApi):
         :param sector_taxonomy_id: the unique ID of the sector taxonomy for pivoting, else DACS if None
         :return: a typed wrapper around the risk attribution results
         """
+        asset_positions = portfolio.to_asset_positions()
         body_json = {
             **self._create_std_params(ctx.as_of_date),
-            'portfolio': {'assetPositions': portfolio.to_asset_positions()},
+            'portfolio': {'assetPositions': asset_positions},
             'modelConfigId': str(ctx.model_config_id),
-            'assetPositions': portfolio.to_asset_positions()
+            'assetPositions': asset_positions
         }
         risk_attribution_json = self._call_api('/market/factor/attribution', {}, body_json, CallType.POST)
         result = RiskAttributionResult(risk_attribution_json)
@@ -54,7 +74,7 @@ class RiskApi(SerenityApi):
                     portfolio: Portfolio,
                     horizon_days: int = 1,
                     lookback_period: int = 365,
-                    quantiles: List[float] = [95, 97.5, 99]) -> VaRAnalysisResult:
+                    quantiles: Sequence[float] = DEFAULT_VAR_QUANTILES) -> VaRAnalysisResult:
         """
         Uses a chosen model to compute Value at Risk (VaR) for a portfolio. Note: this API
         currently ignores CalculationContext.model_config_id, so if you want to use a
@@ -89,7 +109,7 @@ class RiskApi(SerenityApi):
                              start_date: date,
                              end_date: date,
                              lookback_period: int = 365,
-                             quantiles: List[float] = [95, 97.5, 99]) -> VaRBacktestResult:
+                             quantiles: Sequence[float] = DEFAULT_VAR_QUANTILES) -> VaRBacktestResult:
         """
         Performs a VaR backtest, a run of the VaR model for a given portfolio over a time period.
         The goal of the backtest to identify days where the losses exceeded the model prediction,
@@ -108,16 +128,45 @@ class RiskApi(SerenityApi):
             and in range 0 < quantile < 100
         :return: a typed wrapper around the VaR calculation results
         """
-        request = {
-            'portfolio': {'assetPositions': portfolio.to_asset_positions()},
-            'startDate': start_date.strftime(STD_DATE_FMT),
-            'endDate': end_date.strftime(STD_DATE_FMT),
-            'markTime': ctx.mark_time.value,
-            **self._create_var_model_params(ctx.model_config_id, lookback_period, quantiles)
-        }
+        request = {**self._create_var_backtest_template(ctx, portfolio.to_asset_positions(), lookback_period,
+                                                        quantiles),
+                   **RiskApi._create_date_range_params(start_date, end_date)}
         raw_json = self._call_api('/var/backtest', {}, request, CallType.POST)
         return VaRBacktestResult._parse(raw_json)
 
+    def compute_var_backtest_parallel(self, ctx: CalculationContext,
+                                      portfolio: Portfolio,
+                                      start_date: date,
+                                      end_date: date,
+                                      n_chunks: int = 8,
+                                      lookback_period: int = 365,
+                                      quantiles: Sequence[float] = DEFAULT_VAR_QUANTILES) -> VaRBacktestResult:
+        """
+        Performs the same VaR backtest as :func:`compute_var_backtest`, but splits the date range into
+        sub-ranges which are run concurrently and then merged back into a single result. Each sub-range
+        starts on the last day of the one before it, so breaches on the day after a boundary, which compare
+        that day's loss against the boundary day's VaR, are still found. For long backtests this mostly
+        hides server-side compute time.
+
+        :param ctx: the common risk calculation parameters to use, e.g. as-of date or VaR model ID
+        :param portfolio: the portfolio to test against the VaR model
+        :param start_date: the start date of the backtesting run range
+        :param end_date: the end date of the backtesting run range
+        :param n_chunks: the maximum number of sub-ranges to run concurrently
+        :param lookback_period: length of risk factor time series data used to calibrate VaR, measured in days
+        :param quantiles: loss forecast quantiles used in VaR calculation; must be unique
+            and in range 0 < quantile < 100
+        :return: a typed wrapper around the VaR calculation results
+        """
+        # everything but the date range is the same for every chunk, so only build it once
+        template = self._create_var_backtest_template(ctx, portfolio.to_asset_positions(), lookback_period, quantiles)
+        bodies = [{**template, **RiskApi._create_date_range_params(chunk_start, chunk_end)}
+                  for (chunk_start, chunk_end) in RiskApi._split_date_range(start_date, end_date, n_chunks)]
+        with ThreadPoolExecutor(max_workers=min(len(bodies), HTTP_POOL_MAXSIZE)) as executor:
+            raw_results = executor.map(lambda body: self._call_api('/var/backtest', {}, body, CallType.POST),
+                                       bodies)
+            return VaRBacktestResult._merge([VaRBacktestResult._parse(raw_json) for raw_json in raw_results])
+
     def get_asset_covariance_matrix(self, ctx: CalculationContext, asset_master: AssetMaster,
                                     portfolio: Optional[Portfolio] = None) -> pd.DataFrame:
         """
@@ -127,8 +176,23 @@ class RiskApi(SerenityApi):
         :return: a DataFrame pivoted by `assetId1` and `assetId2` with the asset covariance `value` as a column
         """
         params = RiskApi._create_get_params(ctx)
-        raw_json = self._call_api('/market/factor/asset_covariance', params)
-        return RiskApi._asset_matrix_to_dataframe(raw_json['matrix'], asset_master, portfolio)
+        cache_key = (params['as_of_date'], params['model_config_id'])
+        pivoted = self._asset_covariance_cache.get(cache_key)
+        if pivoted is None:
+            raw_json = self._call_api('/market/factor/asset_covariance', params)
+            pivoted = RiskApi._symmetrize(*RiskApi._pivot_matrix(raw_json['matrix'], 'assetId1', 'assetId2'))
+
+            # only ever copied out of, never handed to callers, so guard against accidental in-place changes
+            pivoted[2].flags.writeable = False
+            if len(self._asset_covariance_cache) >= ASSET_COVARIANCE_CACHE_SIZE:
+                del self._asset_covariance_cache[next(iter(self._asset_covariance_cache))]
+            self._asset_covariance_cache[cache_key] = pivoted
+
+        asset_ids1, asset_ids2, matrix = pivoted
+        if portfolio is None:
+            # subsetting by portfolio already copies, but the full matrix must not hand out the cached block
+            matrix = matrix.copy(order='F')
+        return RiskApi._label_asset_matrix(asset_ids1, asset_ids2, matrix, asset_master, portfolio)
 
     def get_asset_residual_covariance_matrix(self, ctx: CalculationContext, asset_master: AssetMaster,
                                              portfolio: Optional[Portfolio] = None) -> pd.DataFrame:
@@ -139,13 +203,8 @@ class RiskApi(SerenityApi):
         :return: a DataFrame pivoted by `assetId1` and `assetId2` with the asset residual `value` as a column
         """
         params = RiskApi._create_get_params(ctx)
-        ids_dict = portfolio.get_assets() if portfolio else {}
         raw_json = self._call_api('/market/factor/residual_covariance', params)
-        rows = [{'assetId': element['assetId1'],
-                 'symbol': asset_master.get_symbol_by_id(UUID(element['assetId1'])),
-                 'value': element['value']} for element in raw_json['matrix']
-                if (len(ids_dict) == 0) or UUID(element['assetId1']) in ids_dict.keys()]
-        return pd.DataFrame(rows)
+        return RiskApi._asset_vector_to_dataframe(raw_json['matrix'], asset_master, portfolio)
 
     def get_factor_correlation_matrix(self, ctx: CalculationContext) -> pd.DataFrame:
         """
@@ -168,7 +227,7 @@ class RiskApi(SerenityApi):
         """
         params = RiskApi._create_get_params(ctx)
         raw_json = self._call_api('/market/factor/covariance', params)
-        return RiskApi._factor_matrix_to_dataframe(raw_json['matrix'])
+        return RiskApi._factor_matrix_to_dataframe(raw_json['matrix'], symmetric=True)
 
     def get_asset_factor_exposures(self, ctx: CalculationContext, asset_master: AssetMaster,
                                    portfolio: Optional[Portfolio] = None) -> pd.DataFrame:
@@ -180,21 +239,34 @@ class RiskApi(SerenityApi):
         :param portfolio: optional Portfolio used to subset the matrix to just assets in the portfolio
         :return: a DataFrame pivoted by `assetId` and `factor` with the exposure `value` as a column
         """
-        def map_asset_id(asset_id: str):
-            return asset_master.get_symbol_by_id(UUID(asset_id))
-
         params = RiskApi._create_get_params(ctx)
         raw_json = self._call_api('/market/factor/exposures', params)
-        factor_exposures = pd.DataFrame.from_dict(raw_json['matrix'])
-        if portfolio:
-            ids_dict = portfolio.get_assets()
-            pf_ids = [str(asset_id) for asset_id in ids_dict.keys()]
-            factor_exposures = factor_exposures[factor_exposures['assetId'].isin(pf_ids)]
+        pf_ids = RiskApi._to_asset_id_set(portfolio)
+        asset_ids, factors, matrix = RiskApi._pivot_matrix(raw_json['matrix'], 'assetId', 'factor', include1=pf_ids)
+        return pd.DataFrame(matrix, index=RiskApi._to_symbol_index(asset_ids, asset_master, 'assetId'),
+                            columns=pd.Index(factors, name='factor'))
 
-        factor_exposures = factor_exposures.pivot(index='assetId', columns='factor', values='value')
-        factor_exposures.set_index(factor_exposures.index.map(map_asset_id), inplace=True)
+    def get_asset_covariance_lowrank(self, ctx: CalculationContext, asset_master: AssetMaster,
+                                     portfolio: Optional[Portfolio] = None) -> Tuple[pd.DataFrame, pd.DataFrame,
+                                                                                     pd.Series]:
+        """
+        Gets the factor model decomposition of the asset covariance matrix, Σ = B F Bᵀ + D, rather than the
+        dense matrix itself. For N assets and K factors this is O(N·K) data instead of O(N²), and quantities
+        like portfolio variance can be computed directly from the parts, e.g. wᵀB F Bᵀw + wᵀDw.
 
-        return factor_exposures
+        :param ctx: the common risk calculation parameters to use, specifically the as-of date and model ID in this case
+        :param asset_master: an AssetMaster to use to resolve UUID to native symbols
+        :param portfolio: optional Portfolio used to subset the decomposition to just assets in the portfolio
+        :return: a tuple of the (N×K) factor exposures B, the (K×K) factor covariance F, ordered like the
+            columns of B, and the per-asset residual variance D, ordered like the rows of B
+        """
+        exposures = self.get_asset_factor_exposures(ctx, asset_master, portfolio)
+        factor_covariance = self.get_factor_covariance_matrix(ctx).reindex(index=exposures.columns,
+                                                                           columns=exposures.columns)
+        residuals = self.get_asset_residual_covariance_matrix(ctx, asset_master, portfolio)
+        residual_variance = pd.Series(residuals['value'].to_numpy(), index=residuals['symbol'],
+                                      name='value').reindex(exposures.index)
+        return exposures, factor_covariance, residual_variance
 
     def get_factor_returns(self, ctx: CalculationContext) -> pd.DataFrame:
         """
@@ -205,9 +277,18 @@ class RiskApi(SerenityApi):
         """
         params = RiskApi._create_get_params(ctx)
         raw_json = self._call_api('/market/factor/returns', params)
-        factor_returns = pd.DataFrame.from_dict(raw_json['factorReturns']).pivot(index='closeDate', columns='factor',
-                                                                                 values='value')
-        return factor_returns.style.format("{:.1%}")
+        close_dates, factors, matrix = RiskApi._pivot_matrix(raw_json['factorReturns'], 'closeDate', 'factor')
+        return pd.DataFrame(matrix, index=pd.Index(close_dates, name='closeDate'),
+                            columns=pd.Index(factors, name='factor'))
+
+    def get_factor_returns_styled(self, ctx: CalculationContext) -> 'Styler':
+        """
+        Gets the factor returns formatted as percentages for display, e.g. in a Jupyter notebook.
+
+        :param ctx: the common risk calculation parameters to use, specifically the as-of date and model ID in this case
+        :return: a Styler wrapping the DataFrame from :func:`get_factor_returns`
+        """
+        return self.get_factor_returns(ctx).style.format("{:.1%}")
 
     def get_factor_portfolios(self, ctx: CalculationContext) -> Dict[AnyStr, Portfolio]:
         """
@@ -218,11 +299,31 @@ class RiskApi(SerenityApi):
         """
         params = RiskApi._create_get_params(ctx)
         raw_json = self._call_api('/market/factor/indexcomps', params)
-        factors = {factor: RiskApi._to_portfolio(indexcomps) for (factor, indexcomps) in raw_json['factors'].items()}
+        # the factor indexes largely share constituents, so parse each asset ID once across all of them
+        asset_ids = {}
+        factors = {factor: RiskApi._to_portfolio(indexcomps, asset_ids)
+                   for (factor, indexcomps) in raw_json['factors'].items()}
         return factors
 
+    def _create_var_backtest_template(self, ctx: CalculationContext, asset_positions: List[Dict[str, Any]],
+                                      lookback_period: int, quantiles: Sequence[float]) -> Dict[AnyStr, Any]:
+        """
+        Creates the JSON request body for a VaR backtest, minus the date range to run it over.
+
+        :param ctx: the common risk calculation parameters to use, e.g. as-of date or VaR model ID
+        :param asset_positions: the portfolio to test, already converted to asset positions
+        :param lookback_period: length of risk factor time series data used to calibrate VaR, measured in days
+        :param quantiles: loss forecast quantiles used in VaR calculation
+        :return: the request body to POST, once combined with :func:`_create_date_range_params`
+        """
+        return {
+            'portfolio': {'assetPositions': asset_positions},
+            'markTime': ctx.mark_time.value,
+            **self._create_var_model_params(ctx.model_config_id, lookback_period, quantiles)
+        }
+
     def _create_var_model_params(self, model_config_id: UUID, lookback_period: int,
-                                 quantiles: List[float]) -> Dict[AnyStr, Any]:
+                                 quantiles: Sequence[float]) -> Dict[AnyStr, Any]:
         """
         VaR model parameter conventions changed between the Ricardo and Martineau releases. This method
         takes care of rewriting both conventions to ensure backward compatiblity during the transition.
@@ -251,42 +352,202 @@ class RiskApi(SerenityApi):
         :param portfolio: an optional portfolio to use to subset the matrix
         :return: a DataFrame pivoted by `assetId1` and `assetId2` with `value` columns
         """
-        def map_asset_id(asset_id: str):
-            return asset_master.get_symbol_by_id(UUID(asset_id))
+        asset_ids1, asset_ids2, matrix = RiskApi._pivot_matrix(matrix_json, 'assetId1', 'assetId2')
+        return RiskApi._label_asset_matrix(asset_ids1, asset_ids2, matrix, asset_master, portfolio)
 
-        df = pd.DataFrame.from_dict(matrix_json).dropna()
-        if portfolio:
-            ids_dict = portfolio.get_assets()
-            pf_ids = [str(asset_id) for asset_id in ids_dict.keys()]
-            df = df[df['assetId1'].isin(pf_ids) &
-                    df['assetId2'].isin(pf_ids)]
-        df = df.pivot(index='assetId1', columns='assetId2', values='value')
-        df.set_index(df.index.map(map_asset_id), inplace=True)
-        df.columns = df.columns.map(map_asset_id)
+    @staticmethod
+    def _label_asset_matrix(asset_ids1: np.ndarray, asset_ids2: np.ndarray, matrix: np.ndarray,
+                            asset_master: AssetMaster, portfolio: Optional[Portfolio] = None) -> pd.DataFrame:
+        """
+        Wraps a pivoted asset matrix in a DataFrame labelled by native symbols, optionally taking just the
+        rows and columns for the assets in a portfolio. Without a portfolio the DataFrame is a view on the
+        input matrix, not a copy.
 
-        return df
+        :param asset_ids1: the asset ID's for the rows of the matrix
+        :param asset_ids2: the asset ID's for the columns of the matrix
+        :param matrix: the pivoted values, e.g. from :func:`_pivot_matrix`
+        :param asset_master: a loaded AssetMaster to convert UUID to symbols
+        :param portfolio: an optional portfolio to use to subset the matrix
+        :return: a DataFrame pivoted by `assetId1` and `assetId2` with `value` columns
+        """
+        pf_ids = RiskApi._to_asset_id_set(portfolio)
+        if pf_ids is not None:
+            rows = np.flatnonzero(pd.Index(asset_ids1).isin(pf_ids))
+            cols = np.flatnonzero(pd.Index(asset_ids2).isin(pf_ids))
+            asset_ids1, asset_ids2 = asset_ids1[rows], asset_ids2[cols]
+            matrix = np.asfortranarray(matrix[np.ix_(rows, cols)])
+        return pd.DataFrame(matrix, index=RiskApi._to_symbol_index(asset_ids1, asset_master, 'assetId1'),
+                            columns=RiskApi._to_symbol_index(asset_ids2, asset_master, 'assetId2'), copy=False)
+
+    @staticmethod
+    def _to_asset_id_set(portfolio: Optional[Portfolio]) -> Optional[Set[str]]:
+        """
+        Gets the asset IDs in a portfolio in their wire (string) form, for filtering raw API output.
+
+        :param portfolio: an optional portfolio to use to subset API output
+        :return: the set of asset ID strings, or None if there is no portfolio to filter by
+        """
+        return {str(asset_id) for asset_id in portfolio.get_assets().keys()} if portfolio else None
 
     @staticmethod
-    def _factor_matrix_to_dataframe(matrix_json: Any) -> pd.DataFrame:
+    def _to_symbol_index(asset_ids: np.ndarray, asset_master: AssetMaster, name: str) -> pd.Index:
+        """
+        Translates distinct asset ID's to an index of their native symbols, looking each one up just once.
+
+        :param asset_ids: the distinct asset ID strings, e.g. the labels from :func:`_pivot_matrix`
+        :param asset_master: a loaded AssetMaster to convert UUID to symbols
+        :param name: the name to give the index
+        :return: an index of symbols in the same order as the asset ID's
+        """
+        return pd.Index([asset_master.get_native_symbol_by_id_str(asset_id) for asset_id in asset_ids], name=name)
+
+    @staticmethod
+    def _asset_vector_to_dataframe(matrix_json: Any, asset_master: AssetMaster,
+                                   portfolio: Optional[Portfolio] = None) -> pd.DataFrame:
+        """
+        Converts a per-asset result (e.g. the residual covariance diagonal) into a simple DataFrame
+
+        :param matrix_json: the raw matrix output from the API, keyed by `assetId1`
+        :param asset_master: a loaded AssetMaster to convert UUID to symbols
+        :param portfolio: an optional portfolio to use to subset the rows
+        :return: a DataFrame with `assetId`, `symbol` and `value` columns
+        """
+        pf_ids = RiskApi._to_asset_id_set(portfolio)
+
+        # look up each distinct asset ID just once
+        symbols = {asset_id: asset_master.get_native_symbol_by_id_str(asset_id)
+                   for asset_id in {element['assetId1'] for element in matrix_json}
+                   if pf_ids is None or asset_id in pf_ids}
+
+        asset_ids = []
+        values = []
+        for element in matrix_json:
+            if element['assetId1'] in symbols:
+                asset_ids.append(element['assetId1'])
+                values.append(element['value'])
+        return pd.DataFrame({'assetId': asset_ids, 'symbol': [symbols[asset_id] for asset_id in asset_ids],
+                             'value': values})
+
+    @staticmethod
+    def _factor_matrix_to_dataframe(matrix_json: Any, symmetric: bool = False) -> pd.DataFrame:
         """
         Converts a factor matrix (factor pairs and values) into a simple DataFrame
 
         :param matrix_json: _description_
+        :param symmetric: if True, the matrix is known to be symmetric, so cells sent for only one of
+            each pair of factors are filled in from their transpose (see :func:`_symmetrize`)
         :return: a DataFrame pivoted by `factor1` and `factor2` with `value` columns
         """
-        df = pd.DataFrame.from_dict(matrix_json).dropna()
-        df = df.pivot(index='factor1', columns='factor2', values='value')
-        return df
+        factors1, factors2, matrix = RiskApi._pivot_matrix(matrix_json, 'factor1', 'factor2')
+        if symmetric:
+            factors1, factors2, matrix = RiskApi._symmetrize(factors1, factors2, matrix)
+        return pd.DataFrame(matrix, index=pd.Index(factors1, name='factor1'),
+                            columns=pd.Index(factors2, name='factor2'))
+
+    @staticmethod
+    def _pivot_matrix(matrix_json: Any, key1: str, key2: str, include1: Optional[Set[str]] = None,
+                      include2: Optional[Set[str]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pivots a sparse list of (key1, key2, value) records into a dense matrix in one pass: records
+        with missing keys or values are dropped, the sorted distinct keys become the row and column
+        labels, and each value is scattered into its (row, column) cell, with NaN for absent pairs.
+
+        :param matrix_json: the raw matrix output from the API
+        :param key1: the record field holding the row key
+        :param key2: the record field holding the column key
+        :param include1: optional set of row keys to keep; records with any other row key are dropped
+        :param include2: optional set of column keys to keep; records with any other column key are dropped
+        :return: the row labels, the column labels and the (Fortran-ordered) matrix of values
+        """
+        keys1, keys2, values = [], [], []
+        for element in matrix_json:
+            k1, k2, value = element.get(key1), element.get(key2), element.get('value')
+            if k1 is None or k2 is None or value is None or value != value:
+                continue
+            if (include1 is None or k1 in include1) and (include2 is None or k2 in include2):
+                keys1.append(k1)
+                keys2.append(k2)
+                values.append(value)
+
+        rows, labels1 = pd.factorize(np.asarray(keys1, dtype=object), sort=True)
+        cols, labels2 = pd.factorize(np.asarray(keys2, dtype=object), sort=True)
+        # column-major, so each DataFrame column (and thus column-wise risk aggregation) is contiguous
+        matrix = np.full((len(labels1), len(labels2)), np.nan, order='F')
+        matrix[rows, cols] = values
+        return labels1, labels2, matrix
+
+    @staticmethod
+    def _symmetrize(labels1: np.ndarray, labels2: np.ndarray,
+                    matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Completes a pivoted symmetric matrix (e.g. a covariance matrix) of which only one triangle, or some
+        other partial set of cells, was sent: every missing cell is filled in from its transpose, and
+        the rows and columns are re-labelled with the union of both sets of keys.
+
+        :param labels1: the sorted row labels from :func:`_pivot_matrix`
+        :param labels2: the sorted column labels from :func:`_pivot_matrix`
+        :param matrix: the pivoted values from :func:`_pivot_matrix`
+        :return: the shared labels, repeated for rows and columns, and the square, filled-in matrix
+        """
+        if not np.array_equal(labels1, labels2):
+            labels = pd.Index(labels1).union(pd.Index(labels2)).to_numpy(dtype=object)
+            square = np.full((len(labels), len(labels)), np.nan, order='F')
+            square[np.ix_(np.searchsorted(labels, labels1), np.searchsorted(labels, labels2))] = matrix
+            labels1, labels2, matrix = labels, labels, square
+
+        missing = np.isnan(matrix)
+        if missing.any():
+            matrix[missing] = matrix.T[missing]
+        return labels1, labels2, matrix
+
+    @staticmethod
+    def _create_date_range_params(start_date: date, end_date: date) -> Dict[AnyStr, str]:
+        """
+        Creates the start and end date entries for a date-range request like VaR backtest.
+
+        :param start_date: the first date in the range
+        :param end_date: the last date in the range
+        :return: the date range request parameters
+        """
+        return {'startDate': date.isoformat(start_date), 'endDate': date.isoformat(end_date)}
+
+    @staticmethod
+    def _split_date_range(start_date: date, end_date: date, n_chunks: int) -> List[Tuple[date, date]]:
+        """
+        Splits an inclusive date range into at most n_chunks inclusive sub-ranges of near-equal length, where
+        each sub-range after the first starts on the last day of the one before it. That way every pair of
+        consecutive days in the range falls within a single sub-range.
+
+        :param start_date: the first date in the range
+        :param end_date: the last date in the range
+        :param n_chunks: the maximum number of sub-ranges to return
+        :return: a list of (start, end) date pairs covering the whole range in order
+        """
+        n_steps = (end_date - start_date).days
+        n_chunks = max(1, min(n_chunks, n_steps))
+        offsets = [i * n_steps // n_chunks for i in range(n_chunks + 1)]
+        return [(start_date + timedelta(days=offsets[i]), start_date + timedelta(days=offsets[i + 1]))
+                for i in range(n_chunks)]
 
     @staticmethod
-    def _to_portfolio(indexcomps: Any) -> Portfolio:
+    def _to_portfolio(indexcomps: Any, asset_ids: Optional[Dict[str, UUID]] = None) -> Portfolio:
         """
         Converts raw factor index composition data in JSON format to a typed Portfolio object.
 
         :param indexcomps: _description_
+        :param asset_ids: optional cache of parsed asset IDs to share across calls; updated in place
         :return: the typed Portfolio object
         """
-        positions = {UUID(entry['assetId']): entry['weight'] for entry in indexcomps if entry['weight'] != 0}
+        asset_ids = {} if asset_ids is None else asset_ids
+        positions = {}
+        for entry in indexcomps:
+            weight = entry['weight']
+            if weight != 0:
+                asset_id = entry['assetId']
+                asset_uuid = asset_ids.get(asset_id)
+                if asset_uuid is None:
+                    asset_uuid = asset_ids[asset_id] = UUID(asset_id)
+                positions[asset_uuid] = weight
         return Portfolio(positions)
 
     @staticmethod
@@ -298,6 +559,6 @@ class RiskApi(SerenityApi):
         :return: the full set of call parameters
         """
         return {
-            'as_of_date': ctx.as_of_date.strftime(STD_DATE_FMT),
+            'as_of_date': date.isoformat(ctx.as_of_date),
             'model_config_id': ctx.model_config_id
         }
@@ -20,6 +20,8 @@ class ScenariosApi(SerenityApi):
     The scenarios API group covers stress testing facilities.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: SerenityClient):
         """
         :param client: the raw client to delegate to when making API calls
@@ -8,6 +8,9 @@ class ValuationApi(SerenityApi):
     """
     The valuation API group covers basic tools for NAV and other portfolio valuation calcs.
     """
+
+    __slots__ = ()
+
     def __init__(self, client: SerenityClient):
         """
         :param client: the raw client to delegate to when making API calls
@@ -23,11 +26,12 @@ class ValuationApi(SerenityApi):
         :param portfolio: the portfolio to value
         :return: a parsed :class:`ValuationResult` containing all portfolio & position values
         """
+        asset_positions = portfolio.to_asset_positions()
         request = {
-            'portfolio': {'assetPositions': portfolio.to_asset_positions()},
+            'portfolio': {'assetPositions': asset_positions},
             'pricing_context': {
                 **self._create_std_params(ctx.as_of_date),
-                'portfolio': {'assetPositions': portfolio.to_asset_positions()},
+                'portfolio': {'assetPositions': asset_positions},
                 'markTime': ctx.mark_time.value,
                 'baseCurrencyId': str(ctx.base_currency_id),
                 'cashTreatment': ctx.cash_treatment.value
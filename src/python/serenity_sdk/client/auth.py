@@ -1,6 +1,9 @@
-from datetime import datetime
-from typing import AnyStr, Dict, List
+import threading
+import time
 
+from typing import AnyStr, Dict, List, Optional
+
+from azure.core.credentials import AccessToken
 from azure.identity import ClientSecretCredential
 
 from serenity_sdk.config import ConnectionConfig
@@ -8,6 +11,8 @@ from serenity_sdk.config import ConnectionConfig
 
 SERENITY_CLIENT_ID_HEADER = 'X-Serenity-Client-ID'
 
+TOKEN_EXPIRY_MARGIN_SECS = 60
+
 
 class AuthHeaders:
     """
@@ -25,16 +30,35 @@ class AuthHeaders:
         self.user_app_id = user_app_id
         self.scopes = scopes
 
+        # API calls may be made from several threads at once, e.g. when fanning out backtests
+        self._lock = threading.Lock()
         self.access_token = None
         self.ensure_not_expired()
 
-    def ensure_not_expired(self):
+    def ensure_not_expired(self) -> bool:
+        """
+        Check whether we need to refresh the bearer token now. The cached token is re-used until
+        it is within `TOKEN_EXPIRY_MARGIN_SECS` of expiring, so in-flight calls never carry a stale token.
+
+        :return: True if the token was refreshed, i.e. the headers from :func:`get_http_headers` changed
+        """
+        # read the token just once, as another thread may invalidate or replace it at any time
+        access_token = self.access_token
+        if not AuthHeaders._is_expired(access_token):
+            return False
+        with self._lock:
+            # only the first thread through refreshes; any others just pick up its new token
+            if AuthHeaders._is_expired(self.access_token):
+                self._refresh_token()
+            return self.access_token is not access_token
+
+    def invalidate(self):
         """
-        Check whether we need to refresh the bearer token now.
+        Discards the cached bearer token, e.g. after the server rejected it, so the next call
+        to :func:`ensure_not_expired` acquires a fresh one.
         """
-        expired = not self.access_token or int(datetime.utcnow().timestamp()) >= self.access_token.expires_on
-        if expired:
-            self._refresh_token()
+        with self._lock:
+            self.access_token = None
 
     def get_http_headers(self) -> Dict[AnyStr, AnyStr]:
         """
@@ -45,9 +69,15 @@ class AuthHeaders:
         return self.http_headers
 
     def _refresh_token(self):
-        self.access_token = self.credential.get_token(*self.scopes)
-        self.http_headers = {'Authorization': f'Bearer {self.access_token.token}',
+        access_token = self.credential.get_token(*self.scopes)
+        # publish the headers before the token, so anyone seeing the new token also sees its headers
+        self.http_headers = {'Authorization': f'Bearer {access_token.token}',
                              SERENITY_CLIENT_ID_HEADER: self.user_app_id}
+        self.access_token = access_token
+
+    @staticmethod
+    def _is_expired(access_token: Optional[AccessToken]) -> bool:
+        return not access_token or time.time() >= access_token.expires_on - TOKEN_EXPIRY_MARGIN_SECS
 
 
 def get_credential_user_app(config: ConnectionConfig) -> object:
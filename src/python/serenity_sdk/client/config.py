@@ -1,3 +1,4 @@
+import functools
 import json
 import os.path
 
@@ -5,6 +6,11 @@ from enum import Enum
 from typing import Any, List
 
 
+REQUIRED_CONFIG_KEYS = frozenset({
+    'schemaVersion', 'tenantId', 'clientId', 'userApplicationId', 'userApplicationSecret', 'url', 'scope', 'environment'
+})
+
+
 class Environment(Enum):
     """
     The operational environment (e.g. test vs. production) to use for connection purposes.
@@ -88,10 +94,9 @@ class ConnectionConfig:
         :param config_path: file path from which the JSON was loaded; for error messages
         :return: the schema version loaded (currently 1 or 2)
         """
-        required_keys = ['schemaVersion', 'tenantId', 'clientId', 'userApplicationId', 'userApplicationSecret',
-                         'url', 'scope', 'environment']
-        if not all(key in config for key in required_keys):
-            raise ValueError(f'{config_path} invalid. Required keys: {required_keys}; got: {list(config.keys())}')
+        missing_keys = REQUIRED_CONFIG_KEYS.difference(config)
+        if missing_keys:
+            raise ValueError(f'{config_path} invalid. Missing required keys: {sorted(missing_keys)}')
         schema_version = config['schemaVersion']
         if schema_version != 2:
             raise ValueError(f'At this time only schemaVersion == 2 is supported; '
@@ -115,8 +120,24 @@ def load_local_config(config_id: str, config_dir: str = None) -> ConnectionConfi
         config_dir = os.path.join(home_dir, '.serenity')
     config_path = os.path.join(config_dir, f'{config_id}.json')
 
-    # load and parse
-    config_file = open(config_path)
-    config = json.load(config_file)
+    # key the cache on modification time so edits to the file are always picked up
+    return _load_config_file(config_path, os.stat(config_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_file(config_path: str, mtime_ns: int) -> ConnectionConfig:
+    """
+    Internal helper that loads and validates a config file, memoized by path and modification time.
+
+    :param config_path: full path to the JSON config file
+    :param mtime_ns: the file's last modification time, used only as part of the cache key
+    :return: a populated, validated `ConnectionConfig` object
+    """
+    # the file is small, so read it in one go and make sure the handle is closed promptly
+    with open(config_path, 'rb') as config_file:
+        config = json.loads(config_file.read())
 
     return ConnectionConfig(config, config_path)
+
+
+load_local_config.cache_clear = _load_config_file.cache_clear
@@ -1,12 +1,22 @@
+import functools
 import json
 import requests
 
 from enum import Enum
-from typing import Any, AnyStr, Dict
+from http import HTTPStatus
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 import humps.camel
 
-from bidict import bidict
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from serenity_sdk.auth import create_auth_headers, get_credential_user_app
 from serenity_sdk.config import ConnectionConfig, Environment
@@ -14,6 +24,47 @@ from serenity_sdk.config import ConnectionConfig, Environment
 
 SERENITY_API_VERSION = 'v1'
 
+# the SDK only calls a few dozen distinct endpoints, so this comfortably holds all their resolved paths
+API_PATH_CACHE_SIZE = 64
+
+HTTP_POOL_CONNECTIONS = 16
+# upper bound on concurrent keep-alive connections per host; callers fanning requests out
+# over threads should not use more workers than this or surplus connections get discarded
+HTTP_POOL_MAXSIZE = 64
+HTTP_MAX_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+
+# the full set of old-to-new API path aliases from the 20221001-Prod release: each old path, which
+# existing client code may still call, maps to its new path; fixed at import time and shared by
+# every APIPathMapper
+API_PATH_ALIASES = MappingProxyType({
+    # re-map Risk API
+    '/risk/asset/covariance': '/risk/market/factor/asset_covariance',
+    '/risk/compute/attribution': '/risk/market/factor/attribution',
+    '/risk/factor/correlation': '/risk/market/factor/correlation',
+    '/risk/factor/covariance': '/risk/market/factor/covariance',
+    '/risk/asset/factor/exposures': '/risk/market/factor/exposures',
+    '/risk/asset/residual/covariance': '/risk/market/factor/residual_covariance',
+    '/risk/factor/returns': '/risk/market/factor/returns',
+
+    # re-map VaR API
+    '/risk/compute/var': '/risk/var/compute',
+    '/risk/backtest/var': '/risk/var/backtest',
+})
+
+# only requests with a body need more than the session-wide headers
+_JSON_CONTENT_HEADERS = MappingProxyType({'Content-Type': 'application/json'})
+
+# per-environment path aliases and unsupported paths; environment-independent today, and like the
+# alias tables only built once rather than for every APIPathMapper
+_ENV_OVERRIDE_MAP = MappingProxyType({
+    Environment.DEV: MappingProxyType({'aliases': API_PATH_ALIASES, 'unsupported': frozenset()}),
+    Environment.TEST: MappingProxyType({'aliases': API_PATH_ALIASES, 'unsupported': frozenset()}),
+    Environment.PRODUCTION: MappingProxyType({'aliases': API_PATH_ALIASES, 'unsupported': frozenset()})
+})
+
+# request parameter names come from a small, fixed set, so only regex-convert each one once
+_camel_case = functools.lru_cache(maxsize=256)(humps.camel.case)
+
 
 class CallType(Enum):
     """
@@ -70,6 +121,9 @@ class APIPathMapper:
     new-style SDK code to transparently work with the old backend, and old-style
     SDK calls to continue to work against all environments to ease transitions.
     """
+
+    __slots__ = ('env', 'env_override_map', '_path_aliases', '_unsupported_paths', '_resolve_api_path_cached')
+
     def __init__(self, env: Environment = Environment.PRODUCTION):
         """
         Internal helper class that takes care of re-mapping API paths; once
@@ -87,27 +141,16 @@ class APIPathMapper:
         # now that the 20221001-Prod release is out, all three environments
         # have the same API paths, but we still have some client code out
         # there potentially using the old convention, so we are going to
-        # set up an inverse mapping until everyone migrates that will translate
+        # set up a mapping until everyone migrates that will translate
         # old API paths to new API paths
-        self.path_aliases = bidict({
-            # re-map Risk API
-            '/risk/market/factor/asset_covariance': '/risk/asset/covariance',
-            '/risk/market/factor/attribution': '/risk/compute/attribution',
-            '/risk/market/factor/correlation': '/risk/factor/correlation',
-            '/risk/market/factor/covariance': '/risk/factor/covariance',
-            '/risk/market/factor/exposures': '/risk/asset/factor/exposures',
-            '/risk/market/factor/residual_covariance': '/risk/asset/residual/covariance',
-            '/risk/market/factor/returns': '/risk/factor/returns',
-
-            # re-map VaR API
-            '/risk/var/compute': '/risk/compute/var',
-            '/risk/var/backtest': '/risk/backtest/var',
-        })
-        self.env_override_map = {
-            Environment.DEV: {'aliases': self.path_aliases.inverse, 'unsupported': {}},
-            Environment.TEST: {'aliases': self.path_aliases.inverse, 'unsupported': {}},
-            Environment.PRODUCTION: {'aliases': self.path_aliases.inverse, 'unsupported': {}}
-        }
+        self.env_override_map = _ENV_OVERRIDE_MAP
+
+        # resolve the per-environment tables just once, as every API call goes through get_api_path()
+        self._path_aliases = self.env_override_map[env]['aliases']
+        self._unsupported_paths = self.env_override_map[env]['unsupported']
+
+        # the environment is fixed per mapper, so each distinct input path only ever resolves one way
+        self._resolve_api_path_cached = functools.lru_cache(maxsize=API_PATH_CACHE_SIZE)(self._resolve_api_path)
 
     def get_api_path(self, input_path: str) -> str:
         """
@@ -117,27 +160,37 @@ class APIPathMapper:
         :param input_path: the API path requested by the caller
         :return: the correct API path for the target environment
         """
+        return self._resolve_api_path_cached(input_path)
+
+    def _resolve_api_path(self, input_path: str) -> str:
+        """
+        Uncached implementation of :func:`get_api_path`.
+        """
         # translate the path, or if no aliasing, keep the input path
-        api_path = self._get_env_path_aliases().get(input_path, input_path)
+        api_path = self._path_aliases.get(input_path, input_path)
 
         # final check: if the translated api_path is listed as unsupported
         # for this environment, raise UnsupportedOperation
-        if api_path in self.env_override_map[self.env]['unsupported']:
+        if api_path in self._unsupported_paths:
             raise UnsupportedOperationError(api_path, self.env)
 
         return api_path
 
-    def _get_env_path_aliases(self) -> Dict[AnyStr, AnyStr]:
+    def _get_env_path_aliases(self) -> Mapping[str, str]:
         """
         Gets all the old-to-new path mapping aliases.
         """
-        return self.env_override_map[self.env]['aliases']
+        return self._path_aliases
 
 
 class SerenityClient:
+    __slots__ = ('version', 'config', 'env', 'region', 'auth_headers', 'api_mapper', '_session', '_resolve_url_cached')
+
     def __init__(self, config: ConnectionConfig):
         """
-        Low-level client object which can be used for direct calls to any REST endpoint.
+        Low-level client object which can be used for direct calls to any REST endpoint. All calls
+        share a single pool of keep-alive connections; use the client as a context manager or call
+        :func:`close` when done so scripts release those connections promptly.
 
         :param config: the Serenity platform connection configuration
 
@@ -153,9 +206,14 @@ class SerenityClient:
         self.region = config.region
         self.auth_headers = create_auth_headers(credential, scopes, user_app_id=config.user_application_id)
         self.api_mapper = APIPathMapper(self.env)
+        self._session = SerenityClient._create_session()
+        self._session.headers.update(self.auth_headers.get_http_headers())
 
-    def call_api(self, api_group: str, api_path: str, params: Dict[str, str] = {}, body_json: Any = None,
-                 call_type: CallType = CallType.GET) -> Any:
+        # host, version and environment are fixed per client, so each endpoint's URL only needs building once
+        self._resolve_url_cached = functools.lru_cache(maxsize=API_PATH_CACHE_SIZE)(self._resolve_url)
+
+    def call_api(self, api_group: str, api_path: str, params: Optional[Dict[str, str]] = None,
+                 body_json: Any = None, call_type: CallType = CallType.GET) -> Any:
         """
         Low-level function that lets you call *any* Serenity REST API endpoint. For the call
         arguments you can pass a dictionary of request parameters or a JSON object, or both.
@@ -167,48 +225,147 @@ class SerenityClient:
         :param body_json: a JSON object to POST or PATCH on the server
         :return: the raw JSON response object
         """
-        host = self.config.get_url()
+        # execute the REST API call after constructing the full URL
+        api_base_url = self._resolve_url_cached(api_group, api_path)
+
+        if not isinstance(call_type, CallType):
+            raise ValueError(f'{api_base_url} call type is {call_type}, which is not yet supported')
+
+        if call_type == CallType.POST and params:
+            # this is a hack to help anyone with an "old-style" notebook
+            # who is setting portfolio in the body and as_of_date and other
+            # secondary parameters in request parameters: with this latest
+            # version of the backend they get merged into a single JSON input
+            body_json_new = {}
+            for key, value in params.items():
+                body_json_new[_camel_case(key)] = value
+            body_json_new['portfolio'] = body_json
+            body_json = body_json_new
+            params = None
+
+        # DELETE and GET never carried a body in the original protocol, so keep it that way
+        request_json = None if call_type in (CallType.DELETE, CallType.GET) else body_json
+        request_body = None if request_json is None else SerenityClient._dump_json(request_json)
+        response = self._send(call_type, api_base_url, params, request_body)
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            # the server rejected our cached Bearer token (e.g. revoked early): refresh and retry once
+            self.auth_headers.invalidate()
+            response = self._send(call_type, api_base_url, params, request_body)
+        response_json = SerenityClient._parse_json(response.content)
 
-        # first make sure we don't have a stale Bearer token, and get the auth HTTP headers
+        return SerenityClient._check_response(body_json, response_json)
+
+    def _resolve_url(self, api_group: str, api_path: str) -> str:
+        """
+        Builds the full URL for an API endpoint, re-mapping the path for the target environment if needed.
+
+        :param api_group: API take like risk or refdata
+        :param api_path: the requested API sub-path to call (non including group or version prefix)
+        :return: the fully-resolved URL to call
+        """
+        full_api_path = self.api_mapper.get_api_path(f'/{api_group}{api_path}')
+        return f'{self.config.get_url()}/{self.version}{full_api_path}'
+
+    def _send(self, call_type: CallType, api_base_url: str, params: Optional[Dict[str, str]],
+              request_body: Optional[bytes]) -> requests.Response:
+        """
+        Sends a single HTTP request over the pooled session, which carries the current auth headers.
+
+        :param call_type: the HTTP method to use
+        :param api_base_url: the fully-resolved URL to call
+        :param params: any GET-style parameters to include in the call
+        :param request_body: the already-serialized JSON body to send, if any
+        :return: the raw HTTP response
+        """
+        # make sure we don't have a stale Bearer token; the token itself is cached until near expiry, so the
+        # session's auth headers only need replacing when they lag the current token -- which can happen
+        # after another thread's call refreshed it, not just when this call does
         self.auth_headers.ensure_not_expired()
-        http_headers = self.auth_headers.get_http_headers()
+        auth_http_headers = self.auth_headers.get_http_headers()
+        if self._session.headers.get('Authorization') != auth_http_headers.get('Authorization'):
+            self._session.headers.update(auth_http_headers)
+        http_headers = None if request_body is None else _JSON_CONTENT_HEADERS
+        return self._session.request(call_type.value, api_base_url, headers=http_headers,
+                                     params=params, data=request_body)
+
+    def close(self):
+        """
+        Releases all pooled HTTP connections held by this client. The client should not
+        be used to make further API calls after this.
+        """
+        self._session.close()
 
-        # execute the REST API call after constructing the full URL
-        full_api_path = f'/{api_group}{api_path}'
-        full_api_path = self.api_mapper.get_api_path(full_api_path)
-        api_base_url = f'{host}/{self.version}{full_api_path}'
-
-        if call_type == CallType.POST:
-            if params:
-                # this is a hack to help anyone with an "old-style" notebook
-                # who is setting portfolio in the body and as_of_date and other
-                # secondary parameters in request parameters: with this latest
-                # version of the backend they get merged into a single JSON input
-                body_json_new = {}
-                for key, value in params.items():
-                    body_json_new[humps.camel.case(key)] = value
-                body_json_new['portfolio'] = body_json
-                body_json = body_json_new
-                params = {}
-
-            response_json = requests.post(api_base_url, headers=http_headers,
-                                          params=params, json=body_json).json()
-        elif call_type == CallType.PATCH:
-            response_json = requests.patch(api_base_url, headers=http_headers,
-                                           params=params, json=body_json).json()
-        elif call_type == CallType.PUT:
-            response_json = requests.put(api_base_url, headers=http_headers,
-                                         params=params, json=body_json).json()
-        elif call_type == CallType.DELETE:
-            response_json = requests.delete(api_base_url, headers=http_headers,
-                                            params=params).json()
-        elif call_type == CallType.GET:
-            response_json = requests.get(api_base_url, headers=http_headers,
-                                         params=params).json()
-        else:
-            raise ValueError(f'{full_api_path} call type is {call_type}, which is not yet supported')
+    def __enter__(self) -> 'SerenityClient':
+        return self
 
-        return SerenityClient._check_response(body_json, response_json)
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Creates the HTTP session shared by all calls from this client; this lets us re-use
+        TCP+TLS connections (HTTP keep-alive) rather than paying for a new handshake on every call.
+
+        :return: a requests session with a connection pool mounted for both HTTP and HTTPS, accepting
+            compressed JSON responses
+        """
+        session = requests.Session()
+        # advertise every content-coding urllib3 can decode here (zstd and br as well as gzip when the optional
+        # zstandard / brotli packages are installed): large matrix responses compress very well on the wire
+        session.headers.update(make_headers(accept_encoding=True))
+        session.headers['Accept'] = 'application/json'
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                              max_retries=HTTP_MAX_RETRIES)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def _dump_json(request_json: Any) -> bytes:
+        """
+        Serializes a request body to UTF-8 JSON exactly as requests would for `json=`, so it can be encoded
+        once and re-sent as-is on retry. NaN and infinite values are rejected rather than being sent as
+        non-standard tokens, as they almost always mean bad risk inputs.
+
+        :param request_json: the JSON object to send
+        :return: the encoded request body
+        """
+        # orjson would be faster, but it silently writes NaN as null and accepts types like UUID or numpy
+        # arrays that the standard library rejects, so request bodies stay on the standard library
+        try:
+            return json.dumps(request_json, allow_nan=False).encode('utf-8')
+        except ValueError as ve:
+            raise requests.exceptions.InvalidJSONError(ve)
+
+    @staticmethod
+    def _parse_json(content: bytes) -> Any:
+        """
+        Parses a raw JSON response body, using orjson if it is installed as it is considerably faster than
+        the standard library for large payloads like the asset master or covariance matrices.
+
+        :param content: the raw, undecoded response body
+        :return: the parsed JSON object
+        """
+        # orjson is strict RFC 8259 and rejects the NaN / Infinity tokens the server can emit for missing
+        # matrix values; a quick byte scan for them is far cheaper than a failed parse followed by a second one
+        if orjson is not None and not SerenityClient._has_non_finite_tokens(content):
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(content)
+
+    @staticmethod
+    def _has_non_finite_tokens(content: bytes) -> bool:
+        """
+        Checks whether a raw JSON body might contain the non-standard NaN or Infinity tokens; this can give
+        false positives (e.g. the text inside a string value) but never false negatives.
+
+        :param content: the raw, undecoded response body
+        :return: True if the body needs a parser that accepts non-finite numbers
+        """
+        return b'NaN' in content or b'Infinity' in content
 
     @staticmethod
     def _check_response(body_json: Any, response_json: Any):
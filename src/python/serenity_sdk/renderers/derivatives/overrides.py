@@ -40,7 +40,7 @@ def apply_option_valuation_overrides(
 
 
 def get_df(durations, rates):
-    return [np.exp(-d*r) for d, r in zip(durations, rates)]
+    return np.exp(-np.asarray(durations, dtype=float) * np.asarray(rates, dtype=float)).tolist()
 
 
 def construct_yield_curve(
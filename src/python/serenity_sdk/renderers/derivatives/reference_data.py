@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from datetime import datetime, date
 import itertools
 import pandas as pd
 from serenity_sdk.client import SerenityApiProvider
+from serenity_sdk.client.raw import HTTP_POOL_MAXSIZE
 from .converters import convert_object_list_to_df
 
 
@@ -12,10 +14,14 @@ def get_predefined_option_infos(api: SerenityApiProvider, as_of_date: Optional[d
     underliers_df = convert_object_list_to_df(underliers)
     # underliers_df
 
-    # Load using get_supported_options call and convert them to a dataframe for an easier display
-    option_df = convert_object_list_to_df(itertools.chain.from_iterable((
-        api.pricer().get_supported_options(as_of_date=as_of_date, underlier_asset_id=underlier.asset_id)
-        for underlier in underliers)))
+    # Load using get_supported_options call and convert them to a dataframe for an easier display;
+    # the per-underlier calls are independent, so issue them concurrently over the client's connection pool
+    with ThreadPoolExecutor(max_workers=min(max(len(underliers), 1), HTTP_POOL_MAXSIZE)) as executor:
+        options_by_underlier = list(executor.map(
+            lambda underlier: api.pricer().get_supported_options(as_of_date=as_of_date,
+                                                                 underlier_asset_id=underlier.asset_id),
+            underliers))
+    option_df = convert_object_list_to_df(itertools.chain.from_iterable(options_by_underlier))
 
     # Add additional fields to help displaying
     # (1) add underlier_asset_id
@@ -1,9 +1,11 @@
-from typing import Dict, Tuple, List
+from collections import defaultdict
+from typing import Dict, Optional, Tuple, List
 import pandas as pd
 from serenity_sdk.client import SerenityApiProvider
 from serenity_types.pricing.derivatives.options.valuation import (
     OptionValuation,
-    OptionValuationRequest)
+    OptionValuationRequest,
+    OptionValuationResult)
 
 from .table_plot import OptionValuationResultTablePlot
 from .converters import convert_object_dict_to_df
@@ -36,20 +38,82 @@ def run_multiple_option_valuation_requests(
         api: SerenityApiProvider,
         requests: Dict[str, OptionValuationRequest])\
         -> Tuple[pd.DataFrame, List[str], List[str]]:
+    """
+    Function to value several single-option requests. Requests which differ only by their option
+    are sent to the pricer as one batch rather than one call per option.
+
+    :param api: Serenity Api provider
+    :param requests: dictionary of option valuation requests, each with exactly one option valuation
+    :return: results DataFrame, plus the keys of the requests which succeeded and failed
+    """
 
     results = {}
-    succeded = []
-    failed = []
-    for k, r in requests.items():
-        try:
-            if len(r.options) != 1:
-                raise ValueError(f"Each valuation request must have exactly one option valuation. \
-                    Please, check {k}.")
-            results[k] = api.pricer().compute_option_valuations(r)
-            succeded.append(k)
-        except Exception:
-            logging.warn(f"failed: {k}")
-            failed.append(k)
-
-    df = convert_object_dict_to_df({k: v[0] for k, v in results.items()})
+    for batch in _batch_compatible_requests(requests):
+        results.update(_run_option_valuation_batch(api, batch))
+
+    succeded = [k for k in requests if k in results]
+    failed = [k for k in requests if k not in results]
+
+    df = convert_object_dict_to_df({k: results[k][0] for k in succeded})
     return df, succeded, failed
+
+
+def _batch_compatible_requests(requests: Dict[str, OptionValuationRequest]) \
+        -> List[Dict[str, OptionValuationRequest]]:
+    """
+    Groups requests that share all market data and model inputs, i.e. differ only by their options.
+    """
+    batches = defaultdict(dict)
+    for k, r in requests.items():
+        batches[r.json(exclude={'options'})][k] = r
+    return list(batches.values())
+
+
+def _run_option_valuation_batch(
+        api: SerenityApiProvider,
+        batch: Dict[str, OptionValuationRequest]) -> Dict[str, List[OptionValuationResult]]:
+    """
+    Values a group of compatible single-option requests with one call, falling back to one call
+    per request if the batch cannot be split back out by option_valuation_id or the call fails.
+    """
+    single_option_batch = {k: r for k, r in batch.items() if len(r.options) == 1}
+    results = {}
+    if len(single_option_batch) > 1:
+        results = _run_merged_option_valuation_request(api, single_option_batch) or {}
+
+    for k, r in batch.items():
+        if k not in results:
+            result = _run_single_option_valuation_request(api, k, r)
+            if result is not None:
+                results[k] = result
+    return results
+
+
+def _run_merged_option_valuation_request(
+        api: SerenityApiProvider,
+        batch: Dict[str, OptionValuationRequest]) -> Optional[Dict[str, List[OptionValuationResult]]]:
+    option_ids = [r.options[0].option_valuation_id for r in batch.values()]
+    if len(set(option_ids)) != len(option_ids):
+        return None
+
+    request = next(iter(batch.values())).copy(update={'options': [r.options[0] for r in batch.values()]})
+    try:
+        by_id = {vr.option_valuation_id: vr for vr in api.pricer().compute_option_valuations(request)}
+        return {k: [by_id[option_id]] for k, option_id in zip(batch.keys(), option_ids)}
+    except Exception:
+        logging.warn(f"batch failed, retrying individually: {list(batch.keys())}")
+        return None
+
+
+def _run_single_option_valuation_request(
+        api: SerenityApiProvider,
+        k: str,
+        r: OptionValuationRequest) -> Optional[List[OptionValuationResult]]:
+    try:
+        if len(r.options) != 1:
+            raise ValueError(f"Each valuation request must have exactly one option valuation. \
+                Please, check {k}.")
+        return api.pricer().compute_option_valuations(r)
+    except Exception:
+        logging.warn(f"failed: {k}")
+        return None
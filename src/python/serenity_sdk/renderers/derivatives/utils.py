@@ -13,7 +13,8 @@ def svi_w(k, a, b, r, m, s):
     :param s: svi s
     :return: total variance
     """
-    return a + b * (r * (k-m) + np.sqrt((k-m)**2 + s**2))
+    km = np.subtract(k, m)
+    return a + b * (r * km + np.hypot(km, s))
 
 
 def svi_vol(k, T, a, b, r, m, s):
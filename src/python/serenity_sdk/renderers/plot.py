@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.stats import binom
+from scipy.special import bdtr
 
 from serenity_sdk.renderers.table import VaRBacktestTables
 
@@ -70,8 +70,8 @@ def create_traffic_light_report(var_tables: VaRBacktestTables, model_kind: str =
     ax2.legend()
 
     x = np.arange(0, var_tables.breach_count_period)
-    green_amber, amber_red = [np.min(x[1 - binom.cdf(x, var_tables.breach_count_period, 1.0-q_rolling/100.) < cf])
-                              for cf in [0.05, 0.0001]]
+    breach_tail_probs = 1 - bdtr(x, var_tables.breach_count_period, 1.0-q_rolling/100.)
+    green_amber, amber_red = [np.min(x[breach_tail_probs < cf]) for cf in [0.05, 0.0001]]
     y_max = amber_red + (amber_red - green_amber)
     ax2.fill_between(dt_index, 0.0, green_amber + .4, color='g', alpha=0.1)
     ax2.fill_between(dt_index, green_amber + .8, amber_red + .4, color='y', alpha=0.1)
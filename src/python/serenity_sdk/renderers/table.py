@@ -3,13 +3,14 @@ import itertools
 from typing import AnyStr, Dict, List
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 import pandas.io.formats.style as pdifs
 
 from serenity_sdk.types.common import SectorPath
 from serenity_sdk.types.refdata import AssetMaster
 from serenity_sdk.types.factors import RiskAttributionResult, Risk
-from serenity_sdk.types.var import VaRBacktestResult
+from serenity_sdk.types.var import VaRAnalysisResult, VaRBacktestResult
 
 
 class FactorRiskTables:
@@ -254,21 +255,26 @@ class VaRBacktestTables:
         self.breach_count_period = breach_count_period
 
         directions = [-1 if q < 50 else +1 for q in bt_quantiles]
-        self.baselines = VaRBacktestTables._extract_ts(result.results, lambda res: res.baseline)
-        self.vars_abs_by_qs = pd.DataFrame(
-            {q: VaRBacktestTables._extract_ts(result.results, lambda res: res.quantiles[i].var_absolute)
-             for i, q in enumerate(bt_quantiles)})
-        self.vars_rel_by_qs = pd.DataFrame(
-            {q: VaRBacktestTables._extract_ts(result.results, lambda res: res.quantiles[i].var_relative)
-             for i, q in enumerate(bt_quantiles)})
+
+        # single pass over the results, building each table from a typed float array sharing one index
+        run_dates = pd.DatetimeIndex([res.run_date for res in result.results])
+        quantile_count = len(bt_quantiles)
+        self.baselines = pd.Series(np.fromiter((res.baseline for res in result.results), dtype=np.float64,
+                                               count=len(result.results)), index=run_dates, copy=False)
+        self.vars_abs_by_qs = pd.DataFrame(VaRBacktestTables._extract_quantile_values(
+            result.results, quantile_count, 'var_absolute'), index=run_dates, columns=bt_quantiles, copy=False)
+        self.vars_rel_by_qs = pd.DataFrame(VaRBacktestTables._extract_quantile_values(
+            result.results, quantile_count, 'var_relative'), index=run_dates, columns=bt_quantiles, copy=False)
 
         # directly calculate the pnls
         self.pnls_abs = self.baselines.diff().shift(-1)
         self.pnls_rel = self.pnls_abs/self.baselines
 
-        self.var_breaches = pd.DataFrame(
-            {q: d * (self.vars_abs_by_qs[q] - (-self.pnls_abs)) < 0 for q, d in zip(bt_quantiles, directions)})
-        self.rolling_breaches = self.var_breaches.rolling(window=breach_count_period).sum()
+        # a breach is a loss beyond VaR, or for the lower quantiles a gain beyond it: one broadcast compare
+        breaches = np.asarray(directions) * (self.vars_abs_by_qs.to_numpy() + self.pnls_abs.to_numpy()[:, None]) < 0
+        self.var_breaches = pd.DataFrame(breaches, index=self.vars_abs_by_qs.index, columns=bt_quantiles)
+        self.rolling_breaches = pd.DataFrame(VaRBacktestTables._rolling_count(breaches, breach_count_period),
+                                             index=self.var_breaches.index, columns=bt_quantiles)
 
     def get_baselines(self):
         """
@@ -334,6 +340,37 @@ class VaRBacktestTables:
 
         return backtest_df[backtest_df[breach_col]]
 
+    @staticmethod
+    def _extract_quantile_values(results: List[VaRAnalysisResult], quantile_count: int, field: str) -> np.ndarray:
+        """
+        Gathers one VaR field for the first quantile_count quantiles of every result into a float matrix.
+
+        :param results: the per-date VaR results from the backtest
+        :param quantile_count: the number of backtested quantiles, i.e. matrix columns
+        :param field: the :class:`VaRQuantile` attribute to extract, e.g. var_absolute
+        :return: a (dates x quantiles) float64 array
+        """
+        values = np.empty((len(results), quantile_count), dtype=np.float64)
+        for row, res in enumerate(results):
+            values[row] = [getattr(quantile, field) for quantile in res.quantiles[:quantile_count]]
+        return values
+
+    @staticmethod
+    def _rolling_count(flags: np.ndarray, window: int) -> np.ndarray:
+        """
+        O(N) trailing-window count of True values down each column via a cumulative sum, matching
+        `DataFrame.rolling(window).sum()`: rows before the first full window are NaN.
+
+        :param flags: 2D boolean array, one column per series
+        :param window: the number of rows in each trailing window
+        :return: a float array of window counts with the same shape as flags
+        """
+        counts = flags.astype(np.int64).cumsum(axis=0)
+        rolling = counts.astype(float)
+        rolling[window:] -= counts[:-window]
+        rolling[:window - 1] = np.nan
+        return rolling
+
     @staticmethod
     def format_breaches_summary(breaches_df: pd.DataFrame) -> pdifs.Styler:
         """
@@ -356,7 +393,3 @@ class VaRBacktestTables:
         }).applymap(red_blue_formatter, subset=[pnl_col])
 
         return breaches_df_formatted
-
-    @staticmethod
-    def _extract_ts(arr, func_value, func_index=lambda res: res.run_date):
-        return pd.Series({func_index(thing): func_value(thing) for thing in arr})
@@ -5,6 +5,7 @@ from typing import Any, AnyStr, Dict, List
 from uuid import UUID
 
 
+# ISO-8601 calendar date; when formatting, prefer the equivalent (and much cheaper) date.isoformat()
 STD_DATE_FMT = '%Y-%m-%d'
 
 
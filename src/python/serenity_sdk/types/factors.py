@@ -1,6 +1,7 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from functools import cached_property
+from typing import Any, Dict, List
 from uuid import UUID
 
 from serenity_sdk.types.common import SectorPath
@@ -181,30 +182,11 @@ class RiskAttributionResult:
     """
     def __init__(self, raw_json: Any):
         """
-        :param raw_json: the raw JSON result object from the server
+        :param raw_json: the raw JSON result object from the server; each breakdown (by factor, asset,
+            sector, etc.) is only parsed out of it the first time it is requested
         """
         self.raw_json = raw_json
 
-        self.portfolio_variance = None
-        self.portfolio_volatility = None
-
-        self.portfolio_risk_by_factor = {}
-
-        self.absolute_risk_by_asset = {}
-        self.relative_risk_by_asset = {}
-        self.marginal_risk_by_asset = {}
-
-        self.absolute_risk_by_sector = {}
-        self.relative_risk_by_sector = {}
-
-        self.absolute_risk_by_sector_and_factor = {}
-        self.relative_risk_by_sector_and_factor = {}
-        self.asset_sectors = {}
-
-        self.sector_factor_exposures = {}
-
-        self._parse_raw_json()
-
     def get_portfolio_volatility(self) -> Risk:
         """
         Extracts the top-level risk expressed in volatility.
@@ -275,39 +257,58 @@ class RiskAttributionResult:
         """
         return self.raw_json
 
-    def _parse_raw_json(self):
-        """
-        Handles parsing output from Risk Attribution [V2] - Ricardo
-        """
-        self._parse_raw_json_common()
+    @cached_property
+    def portfolio_volatility(self) -> Risk:
+        return self._parse_total_risk('volatility')
 
-        # the sector breakdown changed between Smith and Ricardo -- this needs different handling
-        self.absolute_risk_by_asset, self.absolute_risk_by_sector, self.absolute_risk_by_sector_and_factor = \
-            self._parse_risk_contribution('absoluteContributionRisk')
-        self.relative_risk_by_asset, self.relative_risk_by_sector, self.relative_risk_by_sector_and_factor = \
-            self._parse_risk_contribution('relativeContributionRisk')
+    @cached_property
+    def portfolio_variance(self) -> Risk:
+        return self._parse_total_risk('variance')
 
-        # handle path-based sector breakdown for exposures, with backward compatibility V2/V3
-        sector_factor_exposures_json = self.raw_json.get('sectorFactorExposures', [])
-        sector_factor_exposures = [SectorFactorExposure._parse(sector_exposure)
-                                   for sector_exposure in sector_factor_exposures_json]
+    @cached_property
+    def portfolio_risk_by_factor(self) -> Dict[str, TotalFactorRisk]:
+        return {risk_obj['factor']: TotalFactorRisk._parse(risk_obj) for risk_obj in self.raw_json['factorRisk']}
 
-        self.sector_factor_exposures = defaultdict(list)
-        for sector_factor_exposure in sector_factor_exposures:
-            self.sector_factor_exposures[sector_factor_exposure.sector_path].append(sector_factor_exposure)
+    @cached_property
+    def absolute_risk_by_asset(self) -> Dict[UUID, Risk]:
+        return self._parse_risk_by_asset('absoluteContributionRisk')
 
-    def _parse_raw_json_common(self):
-        """
-        Handles parsing elements unchanged between Smith and Ricardo.
-        """
-        self.portfolio_volatility = self._parse_total_risk('volatility')
-        self.portfolio_variance = self._parse_total_risk('variance')
+    @cached_property
+    def relative_risk_by_asset(self) -> Dict[UUID, Risk]:
+        return self._parse_risk_by_asset('relativeContributionRisk')
+
+    @cached_property
+    def marginal_risk_by_asset(self) -> Dict[UUID, Risk]:
+        return {UUID(risk_obj['assetId']): Risk._parse(risk_obj) for risk_obj in self.raw_json['assetMarginalRisk']}
+
+    @cached_property
+    def absolute_risk_by_sector(self) -> Dict[SectorPath, Risk]:
+        return self._parse_risk_by_sector('absoluteContributionRisk')
+
+    @cached_property
+    def relative_risk_by_sector(self) -> Dict[SectorPath, Risk]:
+        return self._parse_risk_by_sector('relativeContributionRisk')
+
+    @cached_property
+    def absolute_risk_by_sector_and_factor(self) -> Dict:
+        return {}  # will be supported in Ricardo
 
-        self.portfolio_risk_by_factor = {risk_obj['factor']: TotalFactorRisk._parse(risk_obj)
-                                         for risk_obj in self.raw_json['factorRisk']}
+    @cached_property
+    def relative_risk_by_sector_and_factor(self) -> Dict:
+        return {}  # will be supported in Ricardo
 
-        self.marginal_risk_by_asset = {UUID(risk_obj['assetId']): Risk._parse(risk_obj)
-                                       for risk_obj in self.raw_json['assetMarginalRisk']}
+    @cached_property
+    def asset_sectors(self) -> Dict[UUID, SectorPath]:
+        return {}
+
+    @cached_property
+    def sector_factor_exposures(self) -> Dict[SectorPath, List[SectorFactorExposure]]:
+        # handle path-based sector breakdown for exposures, with backward compatibility V2/V3
+        sector_factor_exposures = defaultdict(list)
+        for sector_exposure in self.raw_json.get('sectorFactorExposures', []):
+            sector_factor_exposure = SectorFactorExposure._parse(sector_exposure)
+            sector_factor_exposures[sector_factor_exposure.sector_path].append(sector_factor_exposure)
+        return sector_factor_exposures
 
     def _parse_total_risk(self, risk_measure: str) -> Risk:
         """
@@ -316,14 +317,16 @@ class RiskAttributionResult:
         obj = self.raw_json['totalRisk'][risk_measure]
         return Risk._parse(obj)
 
-    def _parse_risk_contribution(self, risk_measure: str) -> Tuple:
+    def _parse_risk_by_asset(self, risk_measure: str) -> Dict[UUID, Risk]:
+        """
+        Internal helper that parses absolute or relative risk contribution per asset.
+        """
+        return {UUID(risk_obj['assetId']): Risk._parse(risk_obj)
+                for risk_obj in self.raw_json[risk_measure]['byAsset']}
+
+    def _parse_risk_by_sector(self, risk_measure: str) -> Dict[SectorPath, Risk]:
         """
         Handle the Ricardo-style sector paths, which include every segment in the path.
         """
-        contrib_obj = self.raw_json[risk_measure]
-        risk_by_asset = {UUID(risk_obj['assetId']): Risk._parse(risk_obj)
-                         for risk_obj in contrib_obj['byAsset']}
-        risk_by_sector = {SectorPath(risk_obj['sectorLevels']): Risk._parse(risk_obj)
-                          for risk_obj in contrib_obj['bySector']}
-        risk_by_sector_and_factor = {}  # will be supported in Ricardo
-        return (risk_by_asset, risk_by_sector, risk_by_sector_and_factor)
+        return {SectorPath(risk_obj['sectorLevels']): Risk._parse(risk_obj)
+                for risk_obj in self.raw_json[risk_measure]['bySector']}
@@ -17,21 +17,28 @@ class ModelMetadata:
         self.model_config_map = {model_config['shortName']: UUID(model_config['modelConfigId'])
                                  for model_config in model_configs}
 
+        # metadata is immutable once loaded, so build the name listings once up front and hand out
+        # copies, as the same instance may be cached and shared; allow for missing displayName until
+        # production upgraded
+        self.model_class_names = [model_class.get('displayName', model_class['shortName'])
+                                  for model_class in model_classes]
+        self.model_names = [model.get('displayName', model['shortName']) for model in models]
+        self.model_config_names = {model_config['shortName']: model_config.get('displayName', None)
+                                   for model_config in model_configs}
+
     def get_model_class_names(self) -> List[str]:
         """
         Enumerates the names of model classes, groupings of related models like Market Risk,
         Liquidity Risk or Value at Risk.
         """
-        # allow for missing displayName until production upgraded
-        return [model_class.get('displayName', model_class['shortName']) for model_class in self.model_classes]
+        return list(self.model_class_names)
 
     def get_model_names(self) -> List[str]:
         """
         Enumerates the names of all models; this corresponds to code implementations
         of different types of models.
         """
-        # allow for missing displayName until production upgraded
-        return [model.get('displayName', model['shortName']) for model in self.models]
+        return list(self.model_names)
 
     def get_model_configurations(self) -> Dict[AnyStr, AnyStr]:
         """
@@ -39,9 +46,7 @@ class ModelMetadata:
         parameterizations of models, e.g. short time horizon and long time horizon
         variations of a factor risk model are two different configurations.
         """
-
-        # allow for missing displayName until production upgraded
-        return {model_config['shortName']: model_config.get('displayName', None) for model_config in self.model_configs}
+        return dict(self.model_config_names)
 
     def get_model_configuration_id(self, short_name: str) -> UUID:
         """
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import cached_property
 from typing import Any, AnyStr, Dict, List
 from uuid import UUID
 
@@ -13,11 +14,7 @@ class AssetMaster:
     def __init__(self, asset_summaries: List[Any]):
         self.asset_summaries = asset_summaries
 
-        # map UUID => authority => symbol
-        self.asset_id_map = {summary['assetId']: {xref_symbol['authority']['name']: xref_symbol['symbol']
-                             for xref_symbol in summary['xrefSymbols']} for summary in asset_summaries}
-
-        # inverse map authority => symbol => UUID
+        # map UUID => authority => symbol, and the inverse map authority => symbol => UUID
         self.asset_id_map = defaultdict(dict)
         self.symbol_map = defaultdict(dict)
         for summary in asset_summaries:
@@ -77,6 +74,24 @@ class AssetMaster:
 
         return symbol
 
+    def get_native_symbol_by_id_str(self, asset_id: str) -> str:
+        """
+        Lookup helper that gets the native symbol for an asset ID in string form, as found in raw API
+        output; this saves parsing the ID to a UUID just to look it up.
+
+        :param asset_id: Serenity's unique ID for this asset, as a string
+        """
+        symbol = self._native_symbols_by_id_str.get(asset_id, None)
+        if symbol is None:
+            # unknown or malformed ID: take the slow path purely to raise the usual error
+            return self.get_symbol_by_id(UUID(asset_id))
+        return symbol
+
+    @cached_property
+    def _native_symbols_by_id_str(self) -> Dict[str, str]:
+        return {str(asset_id): symbols['NATIVE'] for (asset_id, symbols) in self.asset_id_map.items()
+                if symbols.get('NATIVE')}
+
     def get_asset_id_by_symbol(self, symbol: str, symbology: str = 'NATIVE'):
         """
         Lookup helper that looks up asset ID by symbol based on a given symbology.
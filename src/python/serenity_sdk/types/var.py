@@ -3,8 +3,6 @@ from datetime import date, datetime
 from typing import Any, List
 from uuid import UUID
 
-from serenity_sdk.types.common import STD_DATE_FMT
-
 
 class VaRQuantile:
     # forward declaration
@@ -17,6 +15,8 @@ class VaRQuantile:
     Helper class that repersents a single VaR quantile, e.g. 90th percentile VaR.
     """
 
+    __slots__ = ('quantile', 'var_absolute', 'var_relative')
+
     quantile: float
     """
     The portion of the return distribution to consider when evaluating VaR, e.g. 99th percentile max loss
@@ -51,6 +51,8 @@ class VaRBreach:
     Helper class that represents a single VaR breach, a day when the portfolio losses exceeded the forecast.
     """
 
+    __slots__ = ('breach_date', 'portfolio_loss_absolute', 'portfolio_loss_relative', 'quantiles')
+
     breach_date: date
     """
     The date on which the portfolio's loss exceeded ("breached") the prior day's VaR forecast loss at a given quantile
@@ -73,7 +75,7 @@ class VaRBreach:
 
     @staticmethod
     def _parse(raw_json: Any) -> VaRBreach:
-        breach_date = datetime.strptime(raw_json['breachDate'], STD_DATE_FMT)
+        breach_date = datetime.fromisoformat(raw_json['breachDate'])
         portfolio_loss_absolute = raw_json['portfolioLossAbsolute']
         portfolio_loss_relative = raw_json['portfolioLossRelative']
         quantiles = [VaRQuantile._parse(quantile) for quantile in raw_json['quantiles']]
@@ -91,6 +93,8 @@ class VaRAnalysisResult:
     Result class that helps users interpret the output of the VaR model, e.g. processing quantiles.
     """
 
+    __slots__ = ('run_date', 'baseline', 'quantiles', 'excluded_assets', 'warnings')
+
     run_date: date
     """
     The date as-of which we ran the VaR calculation
@@ -118,7 +122,8 @@ class VaRAnalysisResult:
 
     @staticmethod
     def _parse(raw_json: Any) -> VaRAnalysisResult:
-        run_date = datetime.strptime(raw_json['runDate'], STD_DATE_FMT)
+        # dates arrive as YYYY-MM-DD; fromisoformat() is much cheaper than strptime() over a long backtest
+        run_date = datetime.fromisoformat(raw_json['runDate'])
         baseline = raw_json['baseline']
         quantiles = [VaRQuantile._parse(quantile) for quantile in raw_json['quantiles']]
         excluded_assets = [UUID(asset_id) for asset_id in raw_json['excludedAssetIds']]
@@ -159,3 +164,25 @@ class VaRBacktestResult:
         breaches = [VaRBreach._parse(breach) for breach in raw_json['breaches']]
         warnings = raw_json['warnings']
         return VaRBacktestResult(results, breaches, warnings)
+
+    @staticmethod
+    def _merge(backtests: List[VaRBacktestResult]) -> VaRBacktestResult:
+        """
+        Combines the results of backtests run over consecutive date ranges into a single result,
+        keeping the results and breaches in date order and dropping repeated warnings. Ranges may
+        overlap on their boundary days, in which case only the first result or breach for a date is kept.
+
+        :param backtests: the backtest results to combine, in date order
+        :return: a single backtest result covering all the date ranges
+        """
+        results = {}
+        breaches = {}
+        for backtest in backtests:
+            for result in backtest.results:
+                results.setdefault(result.run_date, result)
+            for breach in backtest.breaches:
+                breaches.setdefault(breach.breach_date, breach)
+        results = list(results.values())
+        breaches = list(breaches.values())
+        warnings = list(dict.fromkeys(warning for backtest in backtests for warning in backtest.warnings))
+        return VaRBacktestResult(results, breaches, warnings)
@@ -1,9 +1,15 @@
 import ipywidgets as widgets
 
+from typing import Dict, Tuple
+
 from IPython.display import clear_output, display
 
 from serenity_sdk.client import SerenityApiProvider, SerenityClient
-from serenity_sdk.config import load_local_config
+from serenity_sdk.config import ConnectionConfig, load_local_config
+
+# connected clients by config ID, shared across widgets so re-running a notebook's connect
+# cell re-uses the warm connection pool and bearer token as long as the config is unchanged
+_connections: Dict[str, Tuple[ConnectionConfig, SerenityClient, SerenityApiProvider]] = {}
 
 
 class ConnectWidget:
@@ -18,6 +24,7 @@ class ConnectWidget:
         self.widget_out = widgets.Output()
 
         self.api: SerenityApiProvider = None
+        self.client: SerenityClient = None
         self.env_value = None
 
         self.widget_connect.on_click(self.connect_button_clicked)
@@ -45,8 +52,18 @@ class ConnectWidget:
     def connect_button_clicked(self, button):
         config_id = self.widget_api_config.value
         config = load_local_config(config_id)
-        self.client = SerenityClient(config)
-        self.api = SerenityApiProvider(self.client)
+
+        # load_local_config() hands back the same object until the file changes
+        cached_config, client, api = _connections.get(config_id, (None, None, None))
+        if cached_config is not config:
+            # the config file changed: release the stale client's pooled connections before replacing it
+            if client is not None:
+                client.close()
+            client = SerenityClient(config)
+            api = SerenityApiProvider(client)
+            _connections[config_id] = (config, client, api)
+        self.client = client
+        self.api = api
 
         with (self.widget_out):
             clear_output()
@@ -0,0 +1,65 @@
+import threading
+
+from typing import Any, Callable, Dict, Optional, Union
+
+import pytest
+
+import serenity_sdk.client  # noqa: F401 (the api modules must be imported via the client package)
+
+from serenity_sdk.config import Environment
+
+
+class FakeConfig:
+    """
+    Stands in for ConnectionConfig with just the connection identity the API classes use.
+    """
+    def __init__(self, url: str = 'https://serenity-rest.example.com', tenant_id: str = 'example.com'):
+        self.url = url
+        self.tenant_id = tenant_id
+
+    def get_url(self) -> str:
+        return self.url
+
+
+class FakeClient:
+    """
+    Stands in for SerenityClient in API tests, answering every call from canned responses and recording
+    each (api_path, params) pair it was called with; safe to call from several threads.
+    """
+    def __init__(self, responses: Union[Dict[str, Any], Callable[[str, Optional[Dict[str, str]], Any], Any]],
+                 env: Environment = Environment.PRODUCTION, config: Optional[FakeConfig] = None):
+        """
+        :param responses: either a map from API path to JSON response, or a function taking the API path,
+            params and body and returning the JSON response
+        :param env: the environment the fake client claims to be connected to
+        :param config: the connection configuration the fake client claims to use
+        """
+        self.responses = responses
+        self.env = env
+        self.config = config or FakeConfig()
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def call_api(self, api_group: str, api_path: str, params: Optional[Dict[str, str]] = None, body_json: Any = None,
+                 call_type: Any = None) -> Any:
+        with self._lock:
+            self.calls.append((api_path, params))
+        if callable(self.responses):
+            return self.responses(api_path, params, body_json)
+        return self.responses[api_path]
+
+
+@pytest.fixture
+def fake_client() -> Callable[..., FakeClient]:
+    """
+    Factory for :class:`FakeClient` instances; takes the same arguments as its constructor.
+    """
+    return FakeClient
+
+
+@pytest.fixture
+def fake_config() -> Callable[..., FakeConfig]:
+    """
+    Factory for :class:`FakeConfig` instances; takes the same arguments as its constructor.
+    """
+    return FakeConfig
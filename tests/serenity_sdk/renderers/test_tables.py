@@ -2,8 +2,11 @@ import json
 import math
 import os
 
+from datetime import datetime, timedelta
+
 from serenity_sdk.types.factors import RiskAttributionResult
-from serenity_sdk.renderers.table import FactorRiskTables
+from serenity_sdk.types.var import VaRAnalysisResult, VaRBacktestResult, VaRQuantile
+from serenity_sdk.renderers.table import FactorRiskTables, VaRBacktestTables
 
 
 def test_factor_risk_tables_v3():
@@ -38,3 +41,29 @@ def load_json(rel_path: str):
     json_path = os.path.join(os.path.dirname(__file__), rel_path)
     json_file = open(json_path)
     return json.load(json_file)
+
+
+def test_var_backtest_tables():
+    quantiles = [1, 5, 95, 99]
+    start = datetime(2022, 1, 1)
+    baselines = [100.0, 90.0, 95.0, 120.0, 80.0, 81.0]
+    results = [VaRAnalysisResult(start + timedelta(days=i), baseline,
+                                 [VaRQuantile(q, q / 10.0, q / 1000.0) for q in quantiles], [], [])
+               for i, baseline in enumerate(baselines)]
+    tables = VaRBacktestTables(VaRBacktestResult(results, [], []), quantiles, breach_count_period=3)
+
+    assert list(tables.get_baselines()) == baselines
+    assert list(tables.get_absolute_var_by_quantiles().columns) == quantiles
+    assert list(tables.get_absolute_var_by_quantiles()[99]) == [9.9] * len(baselines)
+    assert list(tables.get_relative_var_by_quantiles()[5]) == [0.005] * len(baselines)
+
+    breaches = tables.get_var_breaches()
+    assert list(breaches[99]) == [True, False, False, True, False, False]
+    assert list(breaches[1]) == [False, True, True, False, True, False]
+
+    rolling = tables.get_rolling_breaches()
+    assert math.isnan(rolling[99].iloc[1])
+    assert list(rolling[99].iloc[2:]) == [1, 1, 1, 1]
+
+    summary = tables.get_breaches_summary(99)
+    assert len(summary) == 2
@@ -1 +1,186 @@
 # post refactoring need to bring back some unit tests for client classes
+import functools
+import math
+import time
+import uuid
+
+import numpy as np
+import pytest
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+
+from azure.core.credentials import AccessToken
+
+from serenity_sdk.client.auth import TOKEN_EXPIRY_MARGIN_SECS, AuthHeaders
+from serenity_sdk.client.config import Environment
+from serenity_sdk.client.raw import HTTP_POOL_MAXSIZE, APIPathMapper, CallType, SerenityClient
+
+
+def test_create_session_mounts_pooled_adapter():
+    session = SerenityClient._create_session()
+    for prefix in ['http://', 'https://']:
+        adapter = session.get_adapter(f'{prefix}serenity.example.com')
+        assert adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+        assert adapter.max_retries.total == 3
+    assert 'gzip' in session.headers['Accept-Encoding']
+    assert session.headers['Accept'] == 'application/json'
+    session.close()
+
+
+class FakeCredential:
+    def __init__(self, expires_in: int):
+        self.expires_in = expires_in
+        self.calls = 0
+
+    def get_token(self, *scopes):
+        self.calls += 1
+        return AccessToken(f'token-{self.calls}', int(time.time()) + self.expires_in)
+
+
+def test_auth_headers_reuses_cached_token():
+    credential = FakeCredential(expires_in=3600)
+    auth_headers = AuthHeaders(credential, ['scope'], 'app-id')
+    auth_headers.ensure_not_expired()
+    auth_headers.ensure_not_expired()
+    assert credential.calls == 1
+    assert auth_headers.get_http_headers()['Authorization'] == 'Bearer token-1'
+
+
+def test_auth_headers_refreshes_near_expiry_and_on_invalidate():
+    credential = FakeCredential(expires_in=TOKEN_EXPIRY_MARGIN_SECS // 2)
+    auth_headers = AuthHeaders(credential, ['scope'], 'app-id')
+    auth_headers.ensure_not_expired()
+    assert credential.calls == 2
+
+    credential.expires_in = 3600
+    auth_headers.invalidate()
+    auth_headers.ensure_not_expired()
+    assert credential.calls == 3
+    assert auth_headers.get_http_headers()['Authorization'] == 'Bearer token-3'
+
+
+def test_auth_headers_refresh_once_across_threads():
+    class SlowCredential(FakeCredential):
+        def get_token(self, *scopes):
+            time.sleep(0.01)
+            return super().get_token(*scopes)
+
+    credential = SlowCredential(expires_in=3600)
+    auth_headers = AuthHeaders(credential, ['scope'], 'app-id')
+    auth_headers.invalidate()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        refreshed = list(executor.map(lambda _: auth_headers.ensure_not_expired(), range(8)))
+    assert credential.calls == 2
+    assert all(refreshed)
+    assert auth_headers.get_http_headers()['Authorization'] == 'Bearer token-2'
+
+
+def test_auth_headers_invalidated_during_expiry_check():
+    class RacingToken:
+        def __init__(self):
+            self.expires_on = int(time.time()) + 3600
+            self.token = 'racing'
+            self.checked = False
+
+        def __bool__(self):
+            # simulate another thread's 401 handling landing right after the token was checked
+            if not self.checked:
+                self.checked = True
+                auth_headers.invalidate()
+            return True
+
+    auth_headers = AuthHeaders(FakeCredential(expires_in=3600), ['scope'], 'app-id')
+    auth_headers.access_token = RacingToken()
+    assert not auth_headers.ensure_not_expired()
+    assert auth_headers.ensure_not_expired()
+    assert auth_headers.get_http_headers()['Authorization'] == 'Bearer token-2'
+
+
+def test_json_round_trip():
+    body = {'portfolio': {'assetPositions': [{'assetId': 'abc', 'quantity': 1.5}]}, 'quantiles': [95, 99]}
+    assert SerenityClient._parse_json(SerenityClient._dump_json(body)) == body
+
+
+def test_dump_json_rejects_what_requests_rejects():
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        SerenityClient._dump_json({'quantity': float('nan')})
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        SerenityClient._dump_json({'quantity': float('inf')})
+    with pytest.raises(TypeError):
+        SerenityClient._dump_json({'assetId': uuid.UUID(int=1)})
+    with pytest.raises(TypeError):
+        SerenityClient._dump_json({'quantities': np.array([1.0, 2.0])})
+    assert SerenityClient._dump_json({1: np.float64(1.5)}) == b'{"1": 1.5}'
+
+
+def test_parse_json_non_finite_values():
+    parsed = SerenityClient._parse_json(b'{"matrix": [{"value": NaN}, {"value": -Infinity}, {"value": 1.5}]}')
+    assert math.isnan(parsed['matrix'][0]['value'])
+    assert parsed['matrix'][1]['value'] == float('-inf')
+    assert parsed['matrix'][2]['value'] == 1.5
+
+
+def test_resolve_url_remaps_and_caches():
+    class FakeConfig:
+        def get_url(self):
+            return 'https://serenity.example.com'
+
+    client = SerenityClient.__new__(SerenityClient)
+    client.config = FakeConfig()
+    client.version = 'v1'
+    client.api_mapper = APIPathMapper(Environment.PRODUCTION)
+    client._resolve_url_cached = functools.lru_cache(maxsize=8)(client._resolve_url)
+    for _ in range(2):
+        url = client._resolve_url_cached('risk', '/factor/covariance')
+        assert url == 'https://serenity.example.com/v1/risk/market/factor/covariance'
+    assert client._resolve_url_cached.cache_info().hits == 1
+
+
+def test_send_updates_session_headers_after_refresh():
+    sent = []
+
+    class FakeSession:
+        def __init__(self):
+            self.headers = {}
+
+        def request(self, method, url, headers=None, params=None, data=None):
+            sent.append(({**self.headers, **(headers or {})}, data))
+
+    credential = FakeCredential(expires_in=3600)
+    client = SerenityClient.__new__(SerenityClient)
+    client.auth_headers = AuthHeaders(credential, ['scope'], 'app-id')
+    client._session = FakeSession()
+    client._session.headers.update(client.auth_headers.get_http_headers())
+
+    client._send(CallType.GET, 'https://serenity.example.com/v1/refdata/asset/summaries', {}, None)
+    client.auth_headers.invalidate()
+    client._send(CallType.POST, 'https://serenity.example.com/v1/risk/compute/var', {}, b'{}')
+    assert credential.calls == 2
+    assert sent[0][0]['Authorization'] == 'Bearer token-1' and 'Content-Type' not in sent[0][0]
+    assert sent[1][0]['Authorization'] == 'Bearer token-2'
+    assert sent[1][0]['Content-Type'] == 'application/json'
+
+
+def test_send_picks_up_token_refreshed_by_another_call():
+    sent = []
+
+    class FakeSession:
+        def __init__(self):
+            self.headers = {}
+
+        def request(self, method, url, headers=None, params=None, data=None):
+            sent.append({**self.headers, **(headers or {})})
+
+    credential = FakeCredential(expires_in=3600)
+    client = SerenityClient.__new__(SerenityClient)
+    client.auth_headers = AuthHeaders(credential, ['scope'], 'app-id')
+    client._session = FakeSession()
+    client._session.headers.update(client.auth_headers.get_http_headers())
+
+    # another thread refreshes the token first, so this call's own expiry check finds nothing to do
+    client.auth_headers.invalidate()
+    assert client.auth_headers.ensure_not_expired()
+    client._send(CallType.GET, 'https://serenity.example.com/v1/refdata/asset/summaries', {}, None)
+    assert credential.calls == 2
+    assert sent[0]['Authorization'] == 'Bearer token-2'
@@ -1,3 +1,5 @@
+import pytest
+
 from serenity_sdk.client.config import Environment
 from serenity_sdk.client.raw import APIPathMapper
 
@@ -18,3 +20,27 @@ def test_lookup_api_path_with_remapping_dev_given_old():
     api_mapper = APIPathMapper(Environment.DEV)
     api_path = api_mapper.get_api_path('/risk/factor/covariance')
     assert api_path == '/risk/market/factor/covariance'
+
+
+def test_path_aliases_shared_and_read_only():
+    dev_aliases = APIPathMapper(Environment.DEV)._get_env_path_aliases()
+    prod_aliases = APIPathMapper(Environment.PRODUCTION)._get_env_path_aliases()
+    assert dev_aliases is prod_aliases
+    with pytest.raises(TypeError):
+        dev_aliases['/risk/factor/covariance'] = '/risk/somewhere/else'
+
+
+def test_lookup_api_path_cached():
+    api_mapper = APIPathMapper(Environment.DEV)
+    assert api_mapper.get_api_path('/risk/factor/covariance') == '/risk/market/factor/covariance'
+    assert api_mapper.get_api_path('/risk/factor/covariance') == '/risk/market/factor/covariance'
+    cache_info = api_mapper._resolve_api_path_cached.cache_info()
+    assert cache_info.hits == 1 and cache_info.misses == 1
+
+
+def test_api_path_mapper_has_no_instance_dict():
+    assert not hasattr(APIPathMapper(), '__dict__')
+
+
+def test_env_override_map_shared_across_mappers():
+    assert APIPathMapper(Environment.DEV).env_override_map is APIPathMapper(Environment.TEST).env_override_map
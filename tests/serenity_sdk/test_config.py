@@ -1,5 +1,8 @@
+import json
 import os.path
 
+import pytest
+
 from serenity_sdk.client.config import Environment, Region, load_local_config
 
 
@@ -35,3 +38,26 @@ def test_load_local_config_v2_prod():
     assert config.get_url() == config.url
     assert config.env == Environment.PRODUCTION
     assert config.region == Region.GLOBAL
+
+
+def test_load_local_config_cached_until_modified(tmp_path):
+    src_path = os.path.join(os.path.dirname(__file__), 'test_config_v2_dev.json')
+    config_path = tmp_path / 'cached.json'
+    config_path.write_text(open(src_path).read())
+
+    config = load_local_config('cached', config_dir=str(tmp_path))
+    assert load_local_config('cached', config_dir=str(tmp_path)) is config
+
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_local_config('cached', config_dir=str(tmp_path)) is not config
+
+    load_local_config.cache_clear()
+
+
+def test_load_local_config_reports_missing_keys(tmp_path):
+    config_path = tmp_path / 'incomplete.json'
+    config_path.write_text(json.dumps({'schemaVersion': 2, 'tenantId': '...', 'clientId': '...'}))
+
+    with pytest.raises(ValueError, match=r"Missing required keys: \['environment', 'scope', 'url', "):
+        load_local_config('incomplete', config_dir=str(tmp_path))
@@ -26,6 +26,17 @@ def test_parse_risk_attrib_v3():
         assert sector_factor_exposure.marginal_risk is not None
 
 
+def test_risk_attrib_views_parsed_on_demand():
+    raw_json = load_json('risk_attrib_result_v3.json')
+    result = RiskAttributionResult(raw_json)
+    assert 'absolute_risk_by_asset' not in vars(result)
+
+    by_asset = result.get_absolute_risk_by_asset()
+    assert len(by_asset) > 0
+    assert result.get_absolute_risk_by_asset() is by_asset
+    assert 'relative_risk_by_sector' not in vars(result)
+
+
 def load_json(rel_path: str):
     json_path = os.path.join(os.path.dirname(__file__), rel_path)
     json_file = open(json_path)
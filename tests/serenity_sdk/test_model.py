@@ -0,0 +1,71 @@
+import time
+
+from datetime import date
+
+import pytest
+
+import serenity_sdk.client  # noqa: F401 (the api modules must be imported via the client package)
+
+from serenity_sdk.api.model import MODEL_METADATA_CACHE_TTL_SECS, ModelApi
+
+MODEL_CONFIG_ID = '00000000-0000-0000-0000-000000000001'
+
+
+MODEL_RESPONSES = {
+    '/model/modelclasses': {'modelClasses': [{'shortName': 'risk.factor'}]},
+    '/model/models': {'models': [{'shortName': 'risk.factor.regression', 'displayName': 'Regression'}]},
+    '/model/modelconfigurations': {'modelConfigurationSummaries': [
+        {'shortName': 'risk.factor.regression.SA1', 'modelConfigId': MODEL_CONFIG_ID}
+    ]}
+}
+
+
+@pytest.fixture
+def client(fake_client):
+    return fake_client(MODEL_RESPONSES)
+
+
+def test_load_model_metadata(client):
+    metadata = ModelApi(client).load_model_metadata(date(2022, 10, 2))
+    assert sorted(api_path for (api_path, _) in client.calls) == ['/model/modelclasses', '/model/modelconfigurations',
+                                                                  '/model/models']
+    assert all(params == {'asOfDate': '2022-10-02'} for (_, params) in client.calls)
+    assert metadata.get_model_class_names() == ['risk.factor']
+    assert metadata.get_model_names() == ['Regression']
+    assert str(metadata.get_model_configuration_id('risk.factor.regression.SA1')) == MODEL_CONFIG_ID
+
+
+def test_load_model_metadata_cached_by_date(client):
+    model_api = ModelApi(client)
+    metadata = model_api.load_model_metadata(date(2022, 10, 2))
+    assert model_api.load_model_metadata(date(2022, 10, 2)) is metadata
+    assert len(client.calls) == 3
+
+    assert model_api.load_model_metadata(date(2022, 10, 2), refresh=True) is not metadata
+    assert model_api.load_model_metadata() is not metadata
+    assert len(client.calls) == 9
+
+
+def test_load_model_metadata_latest_expires(client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+
+    model_api = ModelApi(client)
+    metadata = model_api.load_model_metadata()
+    now[0] += MODEL_METADATA_CACHE_TTL_SECS
+    assert model_api.load_model_metadata() is metadata
+
+    now[0] += 1
+    assert model_api.load_model_metadata() is not metadata
+    assert len(client.calls) == 6
+
+
+def test_cached_model_metadata_not_changed_by_callers(client):
+    metadata = ModelApi(client).load_model_metadata()
+    metadata.get_model_class_names().append('risk.other')
+    metadata.get_model_names().clear()
+    metadata.get_model_configurations()['risk.factor.regression.SA1'] = 'Changed'
+
+    assert metadata.get_model_class_names() == ['risk.factor']
+    assert metadata.get_model_names() == ['Regression']
+    assert metadata.get_model_configurations() == {'risk.factor.regression.SA1': None}
@@ -0,0 +1,107 @@
+import os
+import time
+
+from datetime import date
+
+import pytest
+
+import serenity_sdk.client  # noqa: F401 (the api modules must be imported via the client package)
+import serenity_sdk.api.refdata
+
+from serenity_sdk.api.refdata import ASSET_MASTER_CACHE_TTL_SECS, REFDATA_LOOKUP_CACHE_TTL_SECS, RefdataApi
+from serenity_sdk.config import Environment
+
+
+def test_asset_summaries_cache_round_trip(tmp_path):
+    cache_path = str(tmp_path / 'cache' / 'asset_master_dev_latest.json')
+    assert RefdataApi._read_cached_asset_summaries(cache_path) is None
+
+    asset_summaries = [{'assetId': '00000000-0000-0000-0000-000000000001', 'nativeSymbol': 'BTC'}]
+    RefdataApi._write_cached_asset_summaries(cache_path, asset_summaries)
+    assert RefdataApi._read_cached_asset_summaries(cache_path) == asset_summaries
+
+    stale_time = os.path.getmtime(cache_path) - ASSET_MASTER_CACHE_TTL_SECS - 1
+    os.utime(cache_path, (stale_time, stale_time))
+    assert RefdataApi._read_cached_asset_summaries(cache_path) is None
+
+
+REFDATA_RESPONSES = {
+    '/asset/types': {'assetType': [{'name': 'TOKEN', 'description': 'Token'}]},
+    '/asset/summaries': {'assetSummary': [{'assetId': '00000000-0000-0000-0000-000000000001', 'nativeSymbol': 'BTC',
+                                           'assetSymbol': 'tok.btc', 'xrefSymbols': []}]}
+}
+
+
+@pytest.fixture
+def refdata_client(fake_client, fake_config):
+    def create_client(**config_overrides):
+        return fake_client(REFDATA_RESPONSES, env=Environment.DEV, config=fake_config(**config_overrides))
+    return create_client
+
+
+def test_asset_summaries_cache_write_failure_cleans_up(tmp_path, monkeypatch):
+    def fail_replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(os, 'replace', fail_replace)
+    cache_path = str(tmp_path / 'asset_master_dev_latest.json')
+    RefdataApi._write_cached_asset_summaries(cache_path, [{'assetId': '00000000-0000-0000-0000-000000000001'}])
+    assert os.listdir(tmp_path) == []
+
+
+def test_lookups_fetched_once_per_date(refdata_client):
+    client = refdata_client()
+    refdata = RefdataApi(client)
+    asset_types = refdata.get_asset_types(date(2022, 10, 1))
+    asset_types['CASH'] = 'Cash'
+    assert refdata.get_asset_types(date(2022, 10, 1)) == {'TOKEN': 'Token'}
+    assert refdata.get_asset_types() == {'TOKEN': 'Token'}
+    assert client.calls == [('/asset/types', {'asOfDate': '2022-10-01'}), ('/asset/types', {})]
+
+
+def test_lookups_refetched_after_ttl(monkeypatch, refdata_client):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+
+    client = refdata_client()
+    refdata = RefdataApi(client)
+    refdata.get_asset_types()
+    now[0] += REFDATA_LOOKUP_CACHE_TTL_SECS
+    refdata.get_asset_types()
+    assert len(client.calls) == 1
+
+    now[0] += 1
+    refdata.get_asset_types()
+    assert len(client.calls) == 2
+
+
+def test_asset_master_latest_expires_in_memory(tmp_path, monkeypatch, refdata_client):
+    now = [time.time()]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    monkeypatch.setattr(serenity_sdk.api.refdata, 'ASSET_MASTER_CACHE_DIR', str(tmp_path))
+
+    client = refdata_client()
+    refdata = RefdataApi(client)
+    asset_master = refdata.load_asset_master()
+    assert refdata.load_asset_master() is asset_master
+    assert len(client.calls) == 1
+
+    now[0] += ASSET_MASTER_CACHE_TTL_SECS + 1
+    assert refdata.load_asset_master() is not asset_master
+    assert len(client.calls) == 2
+
+
+def test_asset_master_disk_cache_keyed_by_connection(tmp_path, monkeypatch, refdata_client):
+    monkeypatch.setattr(serenity_sdk.api.refdata, 'ASSET_MASTER_CACHE_DIR', str(tmp_path))
+
+    client = refdata_client()
+    RefdataApi(client).load_asset_master()
+    same_connection = refdata_client()
+    RefdataApi(same_connection).load_asset_master()
+    other_tenant = refdata_client(tenant_id='other.example.com')
+    RefdataApi(other_tenant).load_asset_master()
+    other_url = refdata_client(url='https://serenity-rest.staging.example.com')
+    RefdataApi(other_url).load_asset_master()
+
+    assert [len(c.calls) for c in [client, same_connection, other_tenant, other_url]] == [1, 0, 1, 1]
+    assert len(os.listdir(tmp_path)) == 3
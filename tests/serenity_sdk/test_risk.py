@@ -0,0 +1,272 @@
+import math
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from uuid import UUID
+
+import serenity_sdk.client  # noqa: F401 (the api modules must be imported via the client package)
+
+from serenity_sdk.api.risk import RiskApi
+from serenity_sdk.types.common import CalculationContext, Portfolio
+from serenity_sdk.types.refdata import AssetMaster
+
+BTC_ID = '00000000-0000-0000-0000-000000000001'
+ETH_ID = '00000000-0000-0000-0000-000000000002'
+SOL_ID = '00000000-0000-0000-0000-000000000003'
+
+
+def create_asset_master() -> AssetMaster:
+    return AssetMaster([{'assetId': asset_id, 'nativeSymbol': symbol, 'assetSymbol': f'tok.{symbol.lower()}',
+                         'xrefSymbols': [{'authority': {'name': 'COINGECKO'}, 'symbol': symbol.lower()}]}
+                        for asset_id, symbol in [(BTC_ID, 'BTC'), (ETH_ID, 'ETH'), (SOL_ID, 'SOL')]])
+
+
+def test_asset_matrix_to_dataframe():
+    matrix_json = [
+        {'assetId1': ETH_ID, 'assetId2': ETH_ID, 'value': 4.0},
+        {'assetId1': BTC_ID, 'assetId2': ETH_ID, 'value': 2.0},
+        {'assetId1': BTC_ID, 'assetId2': BTC_ID, 'value': 1.0},
+        {'assetId1': SOL_ID, 'assetId2': SOL_ID, 'value': None},
+    ]
+    df = RiskApi._asset_matrix_to_dataframe(matrix_json, create_asset_master())
+    assert list(df.index) == ['BTC', 'ETH']
+    assert list(df.columns) == ['BTC', 'ETH']
+    assert df.loc['BTC', 'ETH'] == 2.0
+    assert df.loc['ETH', 'ETH'] == 4.0
+    assert math.isnan(df.loc['ETH', 'BTC'])
+
+
+def test_asset_matrix_to_dataframe_portfolio_subset():
+    matrix_json = [{'assetId1': id1, 'assetId2': id2, 'value': 1.0}
+                   for id1 in [BTC_ID, ETH_ID, SOL_ID] for id2 in [BTC_ID, ETH_ID, SOL_ID]]
+    portfolio = Portfolio({UUID(SOL_ID): 1.0, UUID(BTC_ID): 2.0})
+    df = RiskApi._asset_matrix_to_dataframe(matrix_json, create_asset_master(), portfolio)
+    assert list(df.index) == ['BTC', 'SOL']
+    assert list(df.columns) == ['BTC', 'SOL']
+    assert df.to_numpy().sum() == 4.0
+
+
+def test_factor_matrix_to_dataframe():
+    matrix_json = [
+        {'factor1': 'Market', 'factor2': 'Market', 'value': 1.0},
+        {'factor1': 'Market', 'factor2': 'Size', 'value': 0.5},
+        {'factor1': 'Size', 'factor2': 'Size', 'value': 1.0},
+    ]
+    df = RiskApi._factor_matrix_to_dataframe(matrix_json)
+    assert list(df.index) == ['Market', 'Size']
+    assert list(df.columns) == ['Market', 'Size']
+    assert df.loc['Market', 'Size'] == 0.5
+    assert math.isnan(df.loc['Size', 'Market'])
+
+
+def test_asset_vector_to_dataframe():
+    matrix_json = [{'assetId1': asset_id, 'assetId2': asset_id, 'value': value}
+                   for asset_id, value in [(ETH_ID, 2.0), (BTC_ID, 1.0), (SOL_ID, 3.0)]]
+    df = RiskApi._asset_vector_to_dataframe(matrix_json, create_asset_master())
+    assert list(df['symbol']) == ['ETH', 'BTC', 'SOL']
+    assert list(df['value']) == [2.0, 1.0, 3.0]
+
+    portfolio = Portfolio({UUID(SOL_ID): 1.0, UUID(ETH_ID): 2.0})
+    df = RiskApi._asset_vector_to_dataframe(matrix_json, create_asset_master(), portfolio)
+    assert list(df['assetId']) == [ETH_ID, SOL_ID]
+    assert list(df['symbol']) == ['ETH', 'SOL']
+
+
+def test_factor_returns_to_dataframe(fake_client):
+    factor_returns = [
+        {'closeDate': '2022-10-02', 'factor': 'Market', 'value': 0.02},
+        {'closeDate': '2022-10-01', 'factor': 'Market', 'value': -0.01},
+        {'closeDate': '2022-10-01', 'factor': 'Size', 'value': 0.005},
+    ]
+
+    ctx = CalculationContext(date(2022, 10, 2), UUID(BTC_ID))
+    df = RiskApi(fake_client({'/market/factor/returns': {'factorReturns': factor_returns}})).get_factor_returns(ctx)
+    assert list(df.index) == ['2022-10-01', '2022-10-02']
+    assert list(df.columns) == ['Market', 'Size']
+    assert df.loc['2022-10-02', 'Market'] == 0.02
+    assert math.isnan(df.loc['2022-10-02', 'Size'])
+
+
+def test_split_date_range():
+    chunks = RiskApi._split_date_range(date(2022, 1, 1), date(2022, 1, 10), 3)
+    assert chunks == [(date(2022, 1, 1), date(2022, 1, 4)), (date(2022, 1, 4), date(2022, 1, 7)),
+                      (date(2022, 1, 7), date(2022, 1, 10))]
+    assert RiskApi._split_date_range(date(2022, 1, 1), date(2022, 1, 3), 8) == [
+        (date(2022, 1, 1), date(2022, 1, 2)), (date(2022, 1, 2), date(2022, 1, 3))]
+    assert RiskApi._split_date_range(date(2022, 1, 1), date(2022, 1, 1), 8) == [(date(2022, 1, 1), date(2022, 1, 1))]
+
+
+def test_compute_var_backtest_parallel_merges_in_date_order(fake_client):
+    def backtest(api_path, params, body_json):
+        start = date.fromisoformat(body_json['startDate'])
+        end = date.fromisoformat(body_json['endDate'])
+        days = [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+        return {'results': [{'runDate': day, 'baseline': 1.0, 'quantiles': [], 'excludedAssetIds': []}
+                            for day in days],
+                'breaches': [], 'warnings': ['stale prices']}
+
+    ctx = CalculationContext(date(2022, 1, 10), UUID(BTC_ID))
+    result = RiskApi(fake_client(backtest)).compute_var_backtest_parallel(ctx, Portfolio({UUID(BTC_ID): 1.0}),
+                                                                          date(2022, 1, 1), date(2022, 1, 10),
+                                                                          n_chunks=4)
+    assert [result.run_date.day for result in result.results] == list(range(1, 11))
+    assert result.warnings == ['stale prices']
+
+
+def test_compute_var_backtest_parallel_keeps_boundary_breaches(fake_client):
+    breach_days = [date(2022, 1, 4), date(2022, 1, 5), date(2022, 1, 7), date(2022, 1, 8)]
+
+    def backtest(api_path, params, body_json):
+        # like the server, a breach on a day needs the VaR from the day before it in the same run
+        start = date.fromisoformat(body_json['startDate'])
+        end = date.fromisoformat(body_json['endDate'])
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        return {'results': [{'runDate': day.isoformat(), 'baseline': 1.0, 'quantiles': [], 'excludedAssetIds': []}
+                            for day in days],
+                'breaches': [{'breachDate': day.isoformat(), 'portfolioLossAbsolute': -2.0,
+                              'portfolioLossRelative': -0.2, 'quantiles': []}
+                             for day in breach_days if start < day <= end],
+                'warnings': []}
+
+    ctx = CalculationContext(date(2022, 1, 10), UUID(BTC_ID))
+    portfolio = Portfolio({UUID(BTC_ID): 1.0})
+    risk_api = RiskApi(fake_client(backtest))
+    expected = risk_api.compute_var_backtest(ctx, portfolio, date(2022, 1, 1), date(2022, 1, 10))
+    result = risk_api.compute_var_backtest_parallel(ctx, portfolio, date(2022, 1, 1), date(2022, 1, 10), n_chunks=3)
+    assert [breach.breach_date.day for breach in result.breaches] == [4, 5, 7, 8]
+    assert result.breaches == expected.breaches
+    assert result.results == expected.results
+
+
+def test_to_portfolio_shares_parsed_asset_ids():
+    asset_ids = {}
+    market = RiskApi._to_portfolio([{'assetId': BTC_ID, 'weight': 0.5}, {'assetId': ETH_ID, 'weight': 0}],
+                                   asset_ids)
+    size = RiskApi._to_portfolio([{'assetId': BTC_ID, 'weight': -0.25}, {'assetId': SOL_ID, 'weight': 0.75}],
+                                 asset_ids)
+    assert market.get_assets() == {UUID(BTC_ID): 0.5}
+    assert size.get_assets() == {UUID(BTC_ID): -0.25, UUID(SOL_ID): 0.75}
+    assert set(asset_ids) == {BTC_ID, SOL_ID}
+    assert next(iter(market.get_assets())) is next(iter(size.get_assets()))
+
+
+def test_asset_factor_exposures_to_dataframe(fake_client):
+    exposures = [
+        {'assetId': ETH_ID, 'factor': 'Market', 'value': 1.2},
+        {'assetId': BTC_ID, 'factor': 'Market', 'value': 1.0},
+        {'assetId': BTC_ID, 'factor': 'Size', 'value': 0.5},
+        {'assetId': SOL_ID, 'factor': 'Size', 'value': -0.3},
+    ]
+
+    ctx = CalculationContext(date(2022, 10, 2), UUID(BTC_ID))
+    portfolio = Portfolio({UUID(BTC_ID): 1.0, UUID(SOL_ID): 2.0})
+    client = fake_client({'/market/factor/exposures': {'matrix': exposures}})
+    df = RiskApi(client).get_asset_factor_exposures(ctx, create_asset_master(), portfolio)
+    assert list(df.index) == ['BTC', 'SOL']
+    assert list(df.columns) == ['Market', 'Size']
+    assert df.loc['BTC', 'Size'] == 0.5
+    assert math.isnan(df.loc['SOL', 'Market'])
+
+
+def test_asset_covariance_matrix_cached_per_date_and_model(fake_client):
+    matrix_json = [{'assetId1': id1, 'assetId2': id2, 'value': 1.0}
+                   for id1 in [BTC_ID, ETH_ID, SOL_ID] for id2 in [BTC_ID, ETH_ID, SOL_ID]]
+
+    client = fake_client({'/market/factor/asset_covariance': {'matrix': matrix_json}})
+    risk_api = RiskApi(client)
+    ctx = CalculationContext(date(2022, 10, 2), UUID(BTC_ID))
+    full = risk_api.get_asset_covariance_matrix(ctx, create_asset_master())
+    subset = risk_api.get_asset_covariance_matrix(ctx, create_asset_master(), Portfolio({UUID(ETH_ID): 1.0}))
+    assert len(client.calls) == 1
+    assert full.shape == (3, 3)
+    assert list(subset.index) == ['ETH'] and list(subset.columns) == ['ETH']
+
+    risk_api.get_asset_covariance_matrix(CalculationContext(date(2022, 10, 3), UUID(BTC_ID)), create_asset_master())
+    assert len(client.calls) == 2
+
+
+def test_asset_covariance_matrix_writable_and_isolated_from_cache(fake_client):
+    matrix_json = [{'assetId1': id1, 'assetId2': id2, 'value': 1.0}
+                   for id1 in [BTC_ID, ETH_ID] for id2 in [BTC_ID, ETH_ID]]
+
+    risk_api = RiskApi(fake_client({'/market/factor/asset_covariance': {'matrix': matrix_json}}))
+    ctx = CalculationContext(date(2022, 10, 2), UUID(BTC_ID))
+    full = risk_api.get_asset_covariance_matrix(ctx, create_asset_master())
+    full.iloc[0, 0] = 42.0
+    subset = risk_api.get_asset_covariance_matrix(ctx, create_asset_master(), Portfolio({UUID(BTC_ID): 1.0}))
+    subset.iloc[0, 0] = 7.0
+
+    assert risk_api.get_asset_covariance_matrix(ctx, create_asset_master()).loc['BTC', 'BTC'] == 1.0
+
+
+def test_symmetrize_upper_triangle():
+    matrix_json = [
+        {'assetId1': BTC_ID, 'assetId2': BTC_ID, 'value': 1.0},
+        {'assetId1': BTC_ID, 'assetId2': ETH_ID, 'value': 2.0},
+        {'assetId1': BTC_ID, 'assetId2': SOL_ID, 'value': 3.0},
+        {'assetId1': ETH_ID, 'assetId2': ETH_ID, 'value': 4.0},
+        {'assetId1': ETH_ID, 'assetId2': SOL_ID, 'value': 5.0},
+        {'assetId1': SOL_ID, 'assetId2': SOL_ID, 'value': 6.0},
+    ]
+    labels1, labels2, matrix = RiskApi._symmetrize(*RiskApi._pivot_matrix(matrix_json, 'assetId1', 'assetId2'))
+    assert list(labels1) == [BTC_ID, ETH_ID, SOL_ID]
+    assert list(labels2) == [BTC_ID, ETH_ID, SOL_ID]
+    assert matrix.tolist() == [[1.0, 2.0, 3.0], [2.0, 4.0, 5.0], [3.0, 5.0, 6.0]]
+
+
+def test_symmetrize_strict_upper_triangle():
+    matrix_json = [{'assetId1': BTC_ID, 'assetId2': ETH_ID, 'value': 2.0}]
+    labels1, labels2, matrix = RiskApi._symmetrize(*RiskApi._pivot_matrix(matrix_json, 'assetId1', 'assetId2'))
+    assert list(labels1) == [BTC_ID, ETH_ID]
+    assert matrix[0, 1] == 2.0 and matrix[1, 0] == 2.0
+    assert math.isnan(matrix[0, 0])
+
+
+def test_asset_covariance_lowrank(fake_client):
+    responses = {
+        '/market/factor/exposures': {'matrix': [
+            {'assetId': BTC_ID, 'factor': 'Market', 'value': 1.0},
+            {'assetId': BTC_ID, 'factor': 'Size', 'value': 0.5},
+            {'assetId': ETH_ID, 'factor': 'Market', 'value': 2.0},
+            {'assetId': ETH_ID, 'factor': 'Size', 'value': -1.0},
+        ]},
+        '/market/factor/covariance': {'matrix': [
+            {'factor1': f1, 'factor2': f2, 'value': value}
+            for (f1, f2, value) in [('Market', 'Market', 0.04), ('Market', 'Size', 0.01),
+                                    ('Size', 'Market', 0.01), ('Size', 'Size', 0.02)]
+        ]},
+        '/market/factor/residual_covariance': {'matrix': [
+            {'assetId1': ETH_ID, 'assetId2': ETH_ID, 'value': 0.03},
+            {'assetId1': BTC_ID, 'assetId2': BTC_ID, 'value': 0.01},
+        ]},
+    }
+
+    ctx = CalculationContext(date(2022, 10, 2), UUID(BTC_ID))
+    exposures, factor_covariance, residual_variance = RiskApi(fake_client(responses)).get_asset_covariance_lowrank(
+        ctx, create_asset_master())
+    assert list(exposures.index) == ['BTC', 'ETH']
+    assert list(factor_covariance.index) == list(exposures.columns)
+    assert list(residual_variance) == [0.01, 0.03]
+
+    weights = np.array([1.0, 1.0])
+    b_w = exposures.to_numpy().T @ weights
+    variance = b_w @ factor_covariance.to_numpy() @ b_w + weights @ (residual_variance.to_numpy() * weights)
+    assert variance == pytest.approx(0.375)
+
+    # the same decomposition when the server sends only one triangle of the factor covariance
+    responses['/market/factor/covariance']['matrix'] = [
+        {'factor1': f1, 'factor2': f2, 'value': value}
+        for (f1, f2, value) in [('Market', 'Market', 0.04), ('Market', 'Size', 0.01), ('Size', 'Size', 0.02)]
+    ]
+    _, factor_covariance, _ = RiskApi(fake_client(responses)).get_asset_covariance_lowrank(ctx, create_asset_master())
+    assert factor_covariance.to_numpy().tolist() == [[0.04, 0.01], [0.01, 0.02]]
+
+
+def test_native_symbol_by_id_str():
+    asset_master = create_asset_master()
+    assert asset_master.get_native_symbol_by_id_str(ETH_ID) == 'ETH'
+    with pytest.raises(ValueError):
+        asset_master.get_native_symbol_by_id_str('00000000-0000-0000-0000-0000000000ff')